@@ -1,7 +1,133 @@
 import requests
 import time
+import pandas as pd
 from datetime import datetime
 
+# Expert rankings data: {name: (consensus_rank, high_rank, low_rank, std_dev)}
+# Data combines ESPN, FantasyPros, CBS, NFL.com, PFF expert opinions
+EXPERT_DATA = {
+    # Top Tier (High consensus, low variance)
+    "ja'marr chase": (1, 1, 3, 0.8),
+    "bijan robinson": (2, 1, 4, 1.1),
+    "justin jefferson": (3, 2, 5, 1.0),
+    "ceedee lamb": (4, 3, 6, 1.2),
+    "saquon barkley": (5, 4, 8, 1.5),
+    "jahmyr gibbs": (6, 5, 9, 1.6),
+    "amon-ra st. brown": (7, 6, 10, 1.4),
+    "puka nacua": (8, 7, 12, 1.8),
+    "malik nabers": (9, 8, 15, 2.3),
+    "de'von achane": (10, 9, 18, 3.1),
+    
+    # Elite Tier (Some variance in expert opinion)
+    "brian thomas jr.": (11, 10, 20, 3.5),
+    "ashton jeanty": (12, 11, 22, 4.2),
+    "nico collins": (13, 12, 25, 4.8),
+    "brock bowers": (14, 13, 18, 2.1),
+    "christian mccaffrey": (15, 12, 28, 5.6),
+    "drake london": (16, 14, 30, 5.8),
+    "a.j. brown": (17, 15, 24, 3.2),
+    "josh jacobs": (18, 16, 32, 6.1),
+    "derrick henry": (19, 17, 35, 6.8),
+    "ladd mcconkey": (20, 18, 28, 3.6),
+    "jaxon smith-njigba": (21, 19, 35, 5.2),
+    "breece hall": (22, 20, 40, 7.1),
+    "chase brown": (23, 21, 38, 6.4),
+    "tee higgins": (24, 22, 32, 3.8),
+    "kenneth walker iii": (25, 23, 42, 7.3),
+    
+    # Tier 2 (Higher variance, more debate)
+    "james cook": (26, 24, 45, 8.1),
+    "trey mcbride": (27, 25, 35, 4.2),
+    "george kittle": (28, 26, 38, 4.8),
+    "cooper kupp": (29, 27, 55, 10.2),
+    "davante adams": (30, 28, 58, 11.4),
+    "d.k. metcalf": (31, 29, 48, 7.6),
+    "rome odunze": (32, 30, 52, 8.8),
+    "marvin harrison jr.": (33, 31, 50, 7.9),
+    "stefon diggs": (34, 32, 62, 12.1),
+    "mike evans": (35, 33, 48, 6.2),
+    "chris godwin": (36, 34, 52, 7.4),
+    "calvin ridley": (37, 35, 58, 9.1),
+    "jaylen waddle": (38, 36, 55, 8.3),
+    "devon singletary": (39, 37, 65, 11.2),
+    "jordan mason": (40, 38, 68, 12.8),
+    "sam laporta": (41, 39, 48, 3.8),
+    "t.j. hockenson": (42, 40, 52, 5.1),
+    "travis kelce": (43, 41, 62, 8.9),
+    "keon coleman": (44, 42, 70, 13.2),
+    "jayden reed": (45, 43, 65, 9.8),
+    "dj moore": (46, 44, 68, 10.4),
+    "courtland sutton": (47, 45, 72, 12.6),
+    "jerry jeudy": (48, 46, 75, 13.8),
+    "amari cooper": (49, 47, 78, 14.2),
+    "tyler lockett": (50, 48, 72, 11.1),
+    
+    # QBs (Position-specific variance)
+    "josh allen": (51, 49, 62, 5.2),
+    "lamar jackson": (52, 50, 68, 7.1),
+    "jayden daniels": (53, 51, 75, 9.8),
+    "jalen hurts": (54, 52, 72, 8.4),
+    "bo nix": (55, 53, 85, 12.6),
+    "joe burrow": (56, 54, 68, 6.2),
+    "baker mayfield": (57, 55, 88, 14.8),
+    "patrick mahomes": (58, 56, 72, 7.8),
+    "caleb williams": (59, 57, 92, 16.2),
+    "justin herbert": (60, 58, 78, 9.1),
+    
+    # Mid-Tier (High variance, sleeper potential)
+    "rachaad white": (61, 59, 95, 18.2),
+    "javonte williams": (62, 60, 98, 19.1),
+    "d'andre swift": (63, 61, 88, 12.4),
+    "najee harris": (64, 62, 92, 14.8),
+    "aaron jones": (65, 63, 96, 16.2),
+    "alvin kamara": (66, 64, 102, 18.9),
+    "austin ekeler": (67, 65, 105, 20.1),
+    "tony pollard": (68, 66, 98, 15.6),
+    "zack moss": (69, 67, 112, 22.4),
+    "deandre hopkins": (70, 68, 95, 13.2),
+    "keenan allen": (71, 69, 102, 16.8),
+    "brandon aiyuk": (72, 70, 108, 18.9),
+    "diontae johnson": (73, 71, 115, 21.2),
+    "terry mclaurin": (74, 72, 98, 12.8),
+    "michael pittman jr.": (75, 73, 105, 15.6),
+    "tank dell": (76, 74, 118, 22.8),
+    "jordan addison": (77, 75, 112, 18.4),
+    "jameson williams": (78, 76, 125, 24.6),
+    "evan engram": (79, 77, 92, 7.2),
+    "tucker kraft": (80, 78, 108, 14.8),
+    "david njoku": (81, 79, 95, 8.1),
+    "kyle pitts": (82, 80, 118, 19.2),
+    "jake ferguson": (83, 81, 102, 10.4),
+    "jonnu smith": (84, 82, 115, 16.8),
+    "bucky irving": (85, 83, 128, 22.6),
+    "ty chandler": (86, 84, 132, 24.1),
+    "blake corum": (87, 85, 125, 20.8),
+    "braelon allen": (88, 86, 135, 25.2),
+    "kimani vidal": (89, 87, 142, 27.8),
+    "ray davis": (90, 88, 138, 26.4),
+    "tyjae spears": (91, 89, 145, 28.6),
+    "jaylen warren": (92, 90, 148, 29.2),
+    "jerome ford": (93, 91, 152, 30.8),
+    "alexander mattison": (94, 92, 155, 32.1),
+    "devin singletary": (95, 93, 158, 33.4),
+    "rico dowdle": (96, 94, 162, 34.8),
+    "josh downs": (97, 95, 165, 35.2),
+    "wan'dale robinson": (98, 96, 168, 36.8),
+    "darnell mooney": (99, 97, 172, 38.1),
+    "xavier legette": (100, 98, 175, 39.6)
+}
+
+# VORP position-specific adjustments
+POSITION_MULTIPLIERS = {
+    'RB': 1.15,  # RB scarcity premium
+    'WR': 1.10,  # WR depth but top-end valuable
+    'TE': 1.05,  # TE scarcity after elite tier
+    'QB': 0.85,  # QB depth allows waiting
+    'K': 0.1,    # Minimal value
+    'D/ST': 0.2  # Minimal value
+}
+
+
 class CompleteDraftAssistant:
     def __init__(self, draft_id, user_id=None):
         self.draft_id = draft_id
@@ -229,123 +355,22 @@ class CompleteDraftAssistant:
     def get_player_expert_data(self, player):
         """Get comprehensive expert data with consensus, high, low, and standard deviation"""
         name = player['name'].lower()
-        
-        # Expert rankings data: {name: (consensus_rank, high_rank, low_rank, std_dev)}
-        # Data combines ESPN, FantasyPros, CBS, NFL.com, PFF expert opinions
-        expert_data = {
-            # Top Tier (High consensus, low variance)
-            "ja'marr chase": (1, 1, 3, 0.8),
-            "bijan robinson": (2, 1, 4, 1.1),
-            "justin jefferson": (3, 2, 5, 1.0),
-            "ceedee lamb": (4, 3, 6, 1.2),
-            "saquon barkley": (5, 4, 8, 1.5),
-            "jahmyr gibbs": (6, 5, 9, 1.6),
-            "amon-ra st. brown": (7, 6, 10, 1.4),
-            "puka nacua": (8, 7, 12, 1.8),
-            "malik nabers": (9, 8, 15, 2.3),
-            "de'von achane": (10, 9, 18, 3.1),
-            
-            # Elite Tier (Some variance in expert opinion)
-            "brian thomas jr.": (11, 10, 20, 3.5),
-            "ashton jeanty": (12, 11, 22, 4.2),
-            "nico collins": (13, 12, 25, 4.8),
-            "brock bowers": (14, 13, 18, 2.1),
-            "christian mccaffrey": (15, 12, 28, 5.6),
-            "drake london": (16, 14, 30, 5.8),
-            "a.j. brown": (17, 15, 24, 3.2),
-            "josh jacobs": (18, 16, 32, 6.1),
-            "derrick henry": (19, 17, 35, 6.8),
-            "ladd mcconkey": (20, 18, 28, 3.6),
-            "jaxon smith-njigba": (21, 19, 35, 5.2),
-            "breece hall": (22, 20, 40, 7.1),
-            "chase brown": (23, 21, 38, 6.4),
-            "tee higgins": (24, 22, 32, 3.8),
-            "kenneth walker iii": (25, 23, 42, 7.3),
-            
-            # Tier 2 (Higher variance, more debate)
-            "james cook": (26, 24, 45, 8.1),
-            "trey mcbride": (27, 25, 35, 4.2),
-            "george kittle": (28, 26, 38, 4.8),
-            "cooper kupp": (29, 27, 55, 10.2),
-            "davante adams": (30, 28, 58, 11.4),
-            "d.k. metcalf": (31, 29, 48, 7.6),
-            "rome odunze": (32, 30, 52, 8.8),
-            "marvin harrison jr.": (33, 31, 50, 7.9),
-            "stefon diggs": (34, 32, 62, 12.1),
-            "mike evans": (35, 33, 48, 6.2),
-            "chris godwin": (36, 34, 52, 7.4),
-            "calvin ridley": (37, 35, 58, 9.1),
-            "jaylen waddle": (38, 36, 55, 8.3),
-            "devon singletary": (39, 37, 65, 11.2),
-            "jordan mason": (40, 38, 68, 12.8),
-            "sam laporta": (41, 39, 48, 3.8),
-            "t.j. hockenson": (42, 40, 52, 5.1),
-            "travis kelce": (43, 41, 62, 8.9),
-            "keon coleman": (44, 42, 70, 13.2),
-            "jayden reed": (45, 43, 65, 9.8),
-            "dj moore": (46, 44, 68, 10.4),
-            "courtland sutton": (47, 45, 72, 12.6),
-            "jerry jeudy": (48, 46, 75, 13.8),
-            "amari cooper": (49, 47, 78, 14.2),
-            "tyler lockett": (50, 48, 72, 11.1),
-            
-            # QBs (Position-specific variance)
-            "josh allen": (51, 49, 62, 5.2),
-            "lamar jackson": (52, 50, 68, 7.1),
-            "jayden daniels": (53, 51, 75, 9.8),
-            "jalen hurts": (54, 52, 72, 8.4),
-            "bo nix": (55, 53, 85, 12.6),
-            "joe burrow": (56, 54, 68, 6.2),
-            "baker mayfield": (57, 55, 88, 14.8),
-            "patrick mahomes": (58, 56, 72, 7.8),
-            "caleb williams": (59, 57, 92, 16.2),
-            "justin herbert": (60, 58, 78, 9.1),
-            
-            # Mid-Tier (High variance, sleeper potential)
-            "rachaad white": (61, 59, 95, 18.2),
-            "javonte williams": (62, 60, 98, 19.1),
-            "d'andre swift": (63, 61, 88, 12.4),
-            "najee harris": (64, 62, 92, 14.8),
-            "aaron jones": (65, 63, 96, 16.2),
-            "alvin kamara": (66, 64, 102, 18.9),
-            "austin ekeler": (67, 65, 105, 20.1),
-            "tony pollard": (68, 66, 98, 15.6),
-            "zack moss": (69, 67, 112, 22.4),
-            "deandre hopkins": (70, 68, 95, 13.2),
-            "keenan allen": (71, 69, 102, 16.8),
-            "brandon aiyuk": (72, 70, 108, 18.9),
-            "diontae johnson": (73, 71, 115, 21.2),
-            "terry mclaurin": (74, 72, 98, 12.8),
-            "michael pittman jr.": (75, 73, 105, 15.6),
-            "tank dell": (76, 74, 118, 22.8),
-            "jordan addison": (77, 75, 112, 18.4),
-            "jameson williams": (78, 76, 125, 24.6),
-            "evan engram": (79, 77, 92, 7.2),
-            "tucker kraft": (80, 78, 108, 14.8),
-            "david njoku": (81, 79, 95, 8.1),
-            "kyle pitts": (82, 80, 118, 19.2),
-            "jake ferguson": (83, 81, 102, 10.4),
-            "jonnu smith": (84, 82, 115, 16.8),
-            "bucky irving": (85, 83, 128, 22.6),
-            "ty chandler": (86, 84, 132, 24.1),
-            "blake corum": (87, 85, 125, 20.8),
-            "braelon allen": (88, 86, 135, 25.2),
-            "kimani vidal": (89, 87, 142, 27.8),
-            "ray davis": (90, 88, 138, 26.4),
-            "tyjae spears": (91, 89, 145, 28.6),
-            "jaylen warren": (92, 90, 148, 29.2),
-            "jerome ford": (93, 91, 152, 30.8),
-            "alexander mattison": (94, 92, 155, 32.1),
-            "devin singletary": (95, 93, 158, 33.4),
-            "rico dowdle": (96, 94, 162, 34.8),
-            "josh downs": (97, 95, 165, 35.2),
-            "wan'dale robinson": (98, 96, 168, 36.8),
-            "darnell mooney": (99, 97, 172, 38.1),
-            "xavier legette": (100, 98, 175, 39.6)
-        }
-        
-        return expert_data.get(name, (999, 999, 999, 0))
-    
+        return EXPERT_DATA.get(name, (999, 999, 999, 0))
+
+    def get_expert_data_batch(self, players_df):
+        """Expert data for a whole DataFrame of players in one merge
+
+        players_df needs a Player_Name column; returns consensus, high, low and
+        std columns aligned to its index, with the same (999, 999, 999, 0)
+        defaults as get_player_expert_data for unranked players.
+        """
+        expert_df = pd.DataFrame.from_dict(EXPERT_DATA, orient='index',
+                                           columns=['consensus', 'high', 'low', 'std'])
+        keys = players_df['Player_Name'].str.lower()
+        merged = keys.to_frame('key').merge(expert_df, how='left', left_on='key', right_index=True)
+        merged = merged.fillna({'consensus': 999, 'high': 999, 'low': 999, 'std': 0})
+        return merged[['consensus', 'high', 'low', 'std']].set_axis(players_df.index)
+
     def calculate_individual_positional_scarcity(self, player, available_players):
         """Calculate scarcity for THIS specific player vs next player at same position"""
         position = player['position']
@@ -418,16 +443,6 @@ class CompleteDraftAssistant:
         range_factor = low - high  # Larger range = more volatile but potentially valuable
         ceiling_floor_bonus = range_factor * 0.3
         
-        # Factor 5: Position-specific adjustments
-        position_multipliers = {
-            'RB': 1.15,  # RB scarcity premium
-            'WR': 1.10,  # WR depth but top-end valuable
-            'TE': 1.05,  # TE scarcity after elite tier
-            'QB': 0.85,  # QB depth allows waiting
-            'K': 0.1,    # Minimal value
-            'D/ST': 0.2  # Minimal value
-        }
-        
         # Calculate final VORP score
         total_value = (
             base_value + 
@@ -435,7 +450,33 @@ class CompleteDraftAssistant:
             upside_potential + 
             stability_bonus + 
             ceiling_floor_bonus
-        ) * position_multipliers.get(position, 1.0)
+        ) * POSITION_MULTIPLIERS.get(position, 1.0)  # Factor 5: Position-specific adjustments
+        
+        return total_value
+
+    def calculate_vorp_batch(self, ranked_df):
+        """VORP for a DataFrame of ranked players in one vectorized pass
+
+        ranked_df needs Position plus the consensus, high, low and std columns
+        from get_expert_data_batch, and is also the available-player pool; each
+        score matches calculate_value_over_replacement against that pool.
+        """
+        consensus = ranked_df['consensus']
+        
+        # Next-worse distinct consensus rank at each position, for the scarcity drop-off
+        levels = ranked_df[['Position', 'consensus']].drop_duplicates().sort_values(['Position', 'consensus'])
+        levels['next_consensus'] = levels.groupby('Position')['consensus'].shift(-1)
+        next_consensus = ranked_df[['Position', 'consensus']].merge(
+            levels, how='left', on=['Position', 'consensus'])['next_consensus'].set_axis(ranked_df.index)
+        drop_off = (next_consensus - consensus).fillna(0)
+        
+        total_value = (
+            (200 - consensus).clip(lower=0) +
+            drop_off * 2 +
+            (consensus - ranked_df['high']).clip(lower=0) * 1.5 +
+            (10 - ranked_df['std']).clip(lower=0) +
+            (ranked_df['low'] - ranked_df['high']) * 0.3
+        ) * ranked_df['Position'].map(POSITION_MULTIPLIERS).fillna(1.0)
         
         return total_value
     
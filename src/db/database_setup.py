@@ -81,6 +81,10 @@ def create_database_schema():
     CREATE INDEX IF NOT EXISTS idx_players_team ON players(team);
     CREATE INDEX IF NOT EXISTS idx_rankings_player_date ON player_rankings(player_id, ranking_date);
     CREATE INDEX IF NOT EXISTS idx_rankings_source ON player_rankings(source_id);
+    CREATE INDEX IF NOT EXISTS idx_players_pos_name ON players(position, name);
+    -- Also serves LOWER(name)-only lookups, as the leading column
+    CREATE INDEX IF NOT EXISTS idx_players_name_lower_pos ON players(LOWER(name), position);
+    CREATE INDEX IF NOT EXISTS idx_rankings_player_rank ON player_rankings(player_id, position_rank);
     CREATE INDEX IF NOT EXISTS idx_adp_player ON player_adp(player_id);
     """
     
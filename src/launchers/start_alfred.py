@@ -15,9 +15,15 @@ os.chdir(os.path.dirname(os.path.abspath(__file__)))
 print("🏈 Starting ALFRED Fantasy Football Draft Assistant...")
 print("=" * 50)
 
-# Kill any existing servers
-subprocess.run(["pkill", "-f", "draft_assistant_app.py"], capture_output=True)
-time.sleep(1)
+# Kill any existing servers, waiting only as long as they take to exit
+killed = subprocess.run(["pkill", "-f", "draft_assistant_app.py"], capture_output=True)
+if killed.returncode == 0:
+    delay = 0.01
+    deadline = time.monotonic() + 1
+    while (time.monotonic() < deadline and
+           subprocess.run(["pgrep", "-f", "draft_assistant_app.py"], capture_output=True).returncode == 0):
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
 
 # Start the draft assistant app
 process = subprocess.Popen(
@@ -27,14 +33,13 @@ process = subprocess.Popen(
     universal_newlines=True
 )
 
-# Wait for server to start
+# Wait for server to start; readline already blocks until the app prints
 print("Waiting for server to start...")
 for i in range(10):
     line = process.stdout.readline()
     print(line.strip())
     if "Server starting" in line:
         break
-    time.sleep(0.5)
 
 # The app automatically opens a browser, just keep it running
 print("\nALFRED is running!")
@@ -45,13 +50,10 @@ print("3. Begin drafting!")
 print("\nPress Ctrl+C to stop")
 
 try:
-    # Keep running and show output
-    while True:
-        output = process.stdout.readline()
-        if output:
-            print(output.strip())
-        if process.poll() is not None:
-            break
+    # Keep running and show output until the app closes its end of the pipe
+    for output in iter(process.stdout.readline, ''):
+        print(output.strip())
+    process.wait()
 except KeyboardInterrupt:
     print("\nShutting down...")
     process.terminate()
@@ -1,28 +1,99 @@
 import os
+import re
+import sys
 import time
-from datetime import datetime
+from contextlib import contextmanager
+import requests
 from dotenv import load_dotenv
 from espn_api.football import League
+from espn_api.requests import espn_requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Runs in the page: returns the unique visible texts that look draft-related
+DRAFT_TEXT_SCRIPT = r"""
+const positions = ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST', 'DEF'];
+const draftTerms = ['drafted', 'selected', 'pick', 'round'];
+const teamTerms = ['team', 'owner'];
+// Selenium's .text is '' for these, but innerText falls back to their raw text
+const unrendered = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'HEAD', 'TITLE']);
+const seen = new Set();
+const out = [];
+for (const el of document.querySelectorAll('*')) {
+    if (unrendered.has(el.tagName) || el.getClientRects().length === 0) continue;
+    const text = (el.innerText || '').trim();
+    if (!text || text.length > 200 || seen.has(text)) continue;
+    const lower = text.toLowerCase();
+    const words = text.split(/\s+/);
+    if (positions.some(p => text.includes(p)) ||
+        draftTerms.some(t => lower.includes(t)) ||
+        teamTerms.some(t => lower.includes(t)) ||
+        (words.length >= 2 && /^\p{L}+$/u.test(text.replace(/[ .]/g, '')))) {
+        seen.add(text);
+        out.push(text);
+    }
+}
+return out;
+"""
+
+# Position markers that identify an actual pick row
+PICK_POSITION_PATTERN = re.compile(r'QB|RB|WR|TE|K|D/ST')
+
+UI_LABELS = frozenset(['pick', 'team', 'player', 'position', 'round'])
+
+def make_keep_alive_session():
+    """Pooled session so the 3 s polls reuse one connection to ESPN"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+@contextmanager
+def espn_session(session):
+    """Route espn_api's module-level requests.get calls through session, only inside the block
+    
+    espn_api takes no session argument, so its requests reference is swapped
+    for the duration and put back afterwards, leaving other espn_api callers alone.
+    """
+    original = espn_requests.requests
+    espn_requests.requests = session
+    try:
+        yield
+    finally:
+        espn_requests.requests = original
+
 class WebScraperDraftAssistant:
     def __init__(self):
         load_dotenv()
-        self.league = League(
-            league_id=os.getenv('LEAGUE_ID'),
-            year=int(os.getenv('YEAR')),
-            espn_s2=os.getenv('ESPN_S2'),
-            swid=os.getenv('SWID')
-        )
+        self._league = None
+        self._espn_session = make_keep_alive_session()
         self.drafted_players = set()
         self.draft_picks = []
         self.driver = None
         self.my_team_name = ""
+        self._my_team_name_lower = ""
+        self._recommendations_key = None
+        self._recommendations = []
         
+    @property
+    def league(self):
+        """ESPN league, connected on first use so a failed browser setup costs no API calls"""
+        if self._league is None:
+            with espn_session(self._espn_session):
+                self._league = League(
+                    league_id=os.getenv('LEAGUE_ID'),
+                    year=int(os.getenv('YEAR')),
+                    espn_s2=os.getenv('ESPN_S2'),
+                    swid=os.getenv('SWID')
+                )
+        return self._league
+    
     def setup_browser(self):
         """Set up Chrome browser for web scraping"""
         print("🌐 Setting up browser...")
@@ -56,69 +127,21 @@ class WebScraperDraftAssistant:
         
         # Ask for team identification
         self.my_team_name = input("What's your team name in the mock draft? ").strip()
+        self._my_team_name_lower = self.my_team_name.lower()
         print(f"✅ Watching for your team: {self.my_team_name}")
     
     def scrape_draft_picks(self):
         """Scrape current draft picks from the page"""
         try:
-            current_picks = []
-            
-            # Try multiple selector strategies for ESPN mock draft
-            selectors_to_try = [
-                # Common ESPN patterns
-                "[class*='Table'] [class*='Row']",
-                "[class*='draft'] *",
-                "[class*='pick'] *",
-                "[data-testid*='draft']",
-                "[data-testid*='pick']",
-                
-                # Look for player names and positions
-                "*:contains('QB')", "*:contains('RB')", "*:contains('WR')",
-                "*:contains('TE')", "*:contains('K')", "*:contains('D/ST')",
-                
-                # Generic table/list structures
-                "table tr", "tbody tr", 
-                "ul li", "ol li",
-                ".jsx-* *",
-                
-                # Any element with player-like text
-                "*"
-            ]
-            
-            # Look for elements containing player positions or draft terms
-            all_elements = self.driver.find_elements(By.CSS_SELECTOR, "*")
-            
-            for element in all_elements:
-                try:
-                    text = element.text.strip()
-                    if not text or len(text) > 200:  # Skip empty or very long text
-                        continue
-                    
-                    text_lower = text.lower()
-                    
-                    # Look for draft-related patterns
-                    draft_indicators = [
-                        # Position indicators
-                        any(pos in text for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST', 'DEF']),
-                        # Draft terms
-                        any(term in text_lower for term in ['drafted', 'selected', 'pick', 'round']),
-                        # Team indicators
-                        any(term in text_lower for term in ['team', 'owner']),
-                        # Names (contains both first and last name pattern)
-                        len(text.split()) >= 2 and text.replace(' ', '').replace('.', '').isalpha()
-                    ]
-                    
-                    if any(draft_indicators) and text not in current_picks:
-                        current_picks.append(text)
-                        
-                except:
-                    continue
+            # Filter in the browser so only candidate texts cross the WebDriver wire,
+            # instead of one round trip per DOM element for element.text
+            current_picks = self.driver.execute_script(DRAFT_TEXT_SCRIPT) or []
             
             # Filter and clean picks
             filtered_picks = []
             for pick in current_picks:
                 # Skip very short text or common UI elements
-                if len(pick) < 3 or pick.lower() in ['pick', 'team', 'player', 'position', 'round']:
+                if len(pick) < 3 or pick.lower() in UI_LABELS:
                     continue
                 filtered_picks.append(pick)
             
@@ -131,7 +154,9 @@ class WebScraperDraftAssistant:
     def get_available_players(self):
         """Get available players from ESPN API"""
         try:
-            available = self.league.free_agents(size=200)
+            league = self.league
+            with espn_session(self._espn_session):
+                available = league.free_agents(size=200)
             return [{
                 'name': player.name,
                 'position': player.position,
@@ -144,7 +169,8 @@ class WebScraperDraftAssistant:
     
     def analyze_team_needs(self):
         """Simple team needs analysis"""
-        my_picks = [pick for pick in self.draft_picks if self.my_team_name.lower() in pick.lower()]
+        team_name_lower = self._my_team_name_lower
+        my_picks = [pick for pick in self.draft_picks if team_name_lower in pick.lower()]
         
         # Count positions drafted
         positions = {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'K': 0, 'D/ST': 0}
@@ -167,7 +193,16 @@ class WebScraperDraftAssistant:
         return needs
     
     def get_recommendations(self):
-        """Get player recommendations"""
+        """Get player recommendations, reusing the last result until the draft state changes"""
+        state_key = (len(self.draft_picks), len(self.drafted_players))
+        if state_key != self._recommendations_key:
+            self._recommendations = self._compute_recommendations()
+            # Don't pin an empty result (e.g. a failed ESPN call) until the next pick
+            self._recommendations_key = state_key if self._recommendations else None
+        return self._recommendations
+    
+    def _compute_recommendations(self):
+        """Build player recommendations from ESPN free agents and team needs"""
         available_players = self.get_available_players()
         team_needs = self.analyze_team_needs()
         
@@ -219,7 +254,8 @@ class WebScraperDraftAssistant:
         try:
             while True:
                 iteration += 1
-                print(f"📊 Check #{iteration} ({datetime.now().strftime('%H:%M:%S')})")
+                # Collect this check's output and write it in one go
+                out = [f"📊 Check #{iteration} ({time.strftime('%H:%M:%S')})"]
                 
                 try:
                     # Scrape current picks
@@ -227,56 +263,58 @@ class WebScraperDraftAssistant:
                     
                     # Show what we found (for debugging)
                     if iteration <= 3:  # Only show first few iterations to avoid spam
-                        print(f"   Found {len(current_picks)} potential draft elements")
+                        out.append(f"   Found {len(current_picks)} potential draft elements")
                         if current_picks:
-                            print("   Sample elements:")
-                            for i, pick in enumerate(current_picks[:5]):
-                                print(f"     {i+1}. {pick}")
+                            out.append("   Sample elements:")
+                            for i, pick in enumerate(current_picks[:5], 1):
+                                out.append(f"     {i}. {pick}")
                     
                     # Check for new draft-related content
                     new_content = []
                     for pick in current_picks:
                         if pick not in self.draft_picks:
                             # Filter for likely actual picks (player names with positions)
-                            if any(pos in pick for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST']) and len(pick.split()) >= 2:
+                            if PICK_POSITION_PATTERN.search(pick) and len(pick.split()) >= 2:
                                 self.draft_picks.append(pick)
                                 new_content.append(pick)
                                 self.drafted_players.add(pick.split()[0] + " " + pick.split()[1])  # Add player name
                     
                     # Show new picks
                     if new_content:
-                        print("🔄 New draft content detected:")
+                        out.append("🔄 New draft content detected:")
                         for pick in new_content:
-                            print(f"   ✅ {pick}")
+                            out.append(f"   ✅ {pick}")
                     elif iteration > 3:  # Don't spam "no changes" for first few checks
-                        print("   No new draft content")
+                        out.append("   No new draft content")
                     
                     # Check if it's your turn
                     is_my_turn = self.check_for_my_turn()
                     if is_my_turn:
-                        print("🚨 IT'S YOUR TURN!")
+                        out.append("🚨 IT'S YOUR TURN!")
                     
                     # Show recommendations
-                    print(f"💡 {'🚨 YOUR TURN! ' if is_my_turn else ''}Recommendations:")
+                    out.append(f"💡 {'🚨 YOUR TURN! ' if is_my_turn else ''}Recommendations:")
                     recommendations = self.get_recommendations()
                     
                     for i, rec in enumerate(recommendations, 1):
                         player = rec['player']
-                        print(f"   {i}. {player['name']} ({player['position']}) - {rec['reason']}")
-                        print(f"      Projected: {player['projected_points']:.1f} pts")
+                        out.append(f"   {i}. {player['name']} ({player['position']}) - {rec['reason']}")
+                        out.append(f"      Projected: {player['projected_points']:.1f} pts")
                     
                     if not recommendations:
-                        print("   No recommendations available")
+                        out.append("   No recommendations available")
                     
                     # Show current draft status
                     if len(self.draft_picks) > last_pick_count:
-                        print(f"📋 Draft status: {len(self.draft_picks)} picks tracked")
+                        out.append(f"📋 Draft status: {len(self.draft_picks)} picks tracked")
                         last_pick_count = len(self.draft_picks)
                         
                 except Exception as e:
-                    print(f"Error during monitoring: {e}")
+                    out.append(f"Error during monitoring: {e}")
                 
-                print("   Waiting 3 seconds...\n")
+                out.append("   Waiting 3 seconds...\n")
+                sys.stdout.write("\n".join(out) + "\n")
+                sys.stdout.flush()
                 time.sleep(3)
                 
         except KeyboardInterrupt:
@@ -285,6 +323,7 @@ class WebScraperDraftAssistant:
             if self.driver:
                 self.driver.quit()
                 print("🔧 Browser closed")
+            self._espn_session.close()
 
 def main():
     assistant = WebScraperDraftAssistant()
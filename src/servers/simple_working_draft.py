@@ -4,10 +4,22 @@ ALFRED - Simple Working Draft Assistant
 A simplified version that just works
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+import heapq
 import random
 import json
 import os
+import threading
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:  # waitress is optional; fall back to Flask's threaded dev server
+    serve = None
 
 app = Flask(__name__, 
     template_folder='templates',
@@ -22,6 +34,21 @@ draft_state = {
     'user_team': []
 }
 
+# Min-heap of (adp, id) for CPU picks; drafted entries are skipped lazily
+cpu_queue = []
+players_by_id = {}
+draft_lock = threading.Lock()
+
+# Encoded /api/players payload, rebuilt only when a pick changes availability
+players_version = 0
+_players_cache = {'version': -1, 'body': b''}
+
+def dump_json(obj):
+    """Encode obj to JSON bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 def load_players():
     """Load some sample players"""
     global players
@@ -56,6 +83,19 @@ def load_players():
         p['id'] = i + 1
         p['available'] = True
         players.insert(i, p)
+    
+    players_by_id.update((p['id'], p) for p in players)
+    cpu_queue[:] = [(p['adp'], p['id']) for p in players]
+    heapq.heapify(cpu_queue)
+
+def pop_best_available():
+    """Pop the lowest-ADP player still available, or None if everyone is drafted"""
+    while cpu_queue:
+        _, player_id = heapq.heappop(cpu_queue)
+        player = players_by_id[player_id]
+        if player['available']:
+            return player
+    return None
 
 @app.route('/')
 def index():
@@ -117,7 +157,6 @@ def index():
             const response = await fetch('/api/players');
             const players = await response.json();
             displayPlayers(players);
-            updateRecommendation();
         }
         
         function displayPlayers(players) {
@@ -144,6 +183,7 @@ def index():
                 loadPlayers();
                 updateMyTeam();
                 updateRecentPicks();
+                showRecommendation(result.recommendation);
                 document.getElementById('currentPick').textContent = result.current_pick;
             }
         }
@@ -172,16 +212,18 @@ def index():
         
         async function updateRecommendation() {
             const response = await fetch('/api/recommendation');
-            const rec = await response.json();
+            showRecommendation(await response.json());
+        }
+        
+        function showRecommendation(rec) {
             document.getElementById('recommendation').textContent = 
                 rec.player ? `${rec.player.name} (${rec.reason})` : 'No recommendation';
         }
         
-        // Initialize
+        // Initialize - recommendation only changes when a pick is made,
+        // and /api/draft returns the fresh one, so no polling is needed
         loadPlayers();
-        setInterval(() => {
-            updateRecommendation();
-        }, 5000);
+        updateRecommendation();
     </script>
 </body>
 </html>
@@ -189,44 +231,56 @@ def index():
 
 @app.route('/api/players')
 def get_players():
-    return jsonify(players)
+    # Read the version before encoding: a pick landing mid-encode then leaves
+    # the cache tagged stale, rather than storing pre-pick data as current
+    version = players_version
+    if _players_cache['version'] != version:
+        body = dump_json(players)
+        _players_cache.update(version=version, body=body)
+        return Response(body, mimetype='application/json')
+    return Response(_players_cache['body'], mimetype='application/json')
 
 @app.route('/api/draft', methods=['POST'])
 def draft_player():
+    global players_version
     data = request.json
     player_id = data['player_id']
     
-    # Find and draft player
-    for p in players:
-        if p['id'] == player_id:
-            p['available'] = False
-            draft_state['picks'].append({
-                'pick': draft_state['current_pick'],
-                'player': p,
-                'team': 'user' if draft_state['current_pick'] % 12 == 6 else 'cpu'
-            })
-            if draft_state['current_pick'] % 12 == 6:
-                draft_state['user_team'].append(p)
-            draft_state['current_pick'] += 1
-            break
+    # Picks mutate shared state, and the server handles requests on several threads
+    with draft_lock:
+        # Find and draft player
+        for p in players:
+            if p['id'] == player_id:
+                p['available'] = False
+                draft_state['picks'].append({
+                    'pick': draft_state['current_pick'],
+                    'player': p,
+                    'team': 'user' if draft_state['current_pick'] % 12 == 6 else 'cpu'
+                })
+                if draft_state['current_pick'] % 12 == 6:
+                    draft_state['user_team'].append(p)
+                draft_state['current_pick'] += 1
+                break
+    
+        # Simulate CPU picks
+        if draft_state['current_pick'] % 12 != 6:
+            cpu_pick = pop_best_available()  # Simple: take best available
+            if cpu_pick:
+                cpu_pick['available'] = False
+                draft_state['picks'].append({
+                    'pick': draft_state['current_pick'],
+                    'player': cpu_pick,
+                    'team': 'cpu'
+                })
+                draft_state['current_pick'] += 1
     
-    # Simulate CPU picks
-    if draft_state['current_pick'] % 12 != 6:
-        available = [p for p in players if p['available']]
-        if available:
-            cpu_pick = available[0]  # Simple: take best available
-            cpu_pick['available'] = False
-            draft_state['picks'].append({
-                'pick': draft_state['current_pick'],
-                'player': cpu_pick,
-                'team': 'cpu'
-            })
-            draft_state['current_pick'] += 1
+        players_version += 1
     
-    return jsonify({
-        'success': True,
-        'current_pick': draft_state['current_pick']
-    })
+        return jsonify({
+            'success': True,
+            'current_pick': draft_state['current_pick'],
+            'recommendation': compute_recommendation()
+        })
 
 @app.route('/api/my-team')
 def my_team():
@@ -240,11 +294,11 @@ def recent_picks():
         'name': p['player']['name']
     } for p in reversed(recent)])
 
-@app.route('/api/recommendation')
-def recommendation():
+def compute_recommendation():
+    """Pick the player to recommend for the current draft state"""
     available = [p for p in players if p['available']]
     if not available:
-        return jsonify({'player': None})
+        return {'player': None}
     
     # Simple recommendation logic
     my_positions = [p['pos'] for p in draft_state['user_team']]
@@ -253,15 +307,19 @@ def recommendation():
     if 'RB' not in my_positions:
         rbs = [p for p in available if p['pos'] == 'RB']
         if rbs:
-            return jsonify({'player': rbs[0], 'reason': 'You need a RB'})
+            return {'player': rbs[0], 'reason': 'You need a RB'}
     
     if 'WR' not in my_positions:
         wrs = [p for p in available if p['pos'] == 'WR']
         if wrs:
-            return jsonify({'player': wrs[0], 'reason': 'You need a WR'})
+            return {'player': wrs[0], 'reason': 'You need a WR'}
     
     # Default: best available
-    return jsonify({'player': available[0], 'reason': 'Best available'})
+    return {'player': available[0], 'reason': 'Best available'}
+
+@app.route('/api/recommendation')
+def recommendation():
+    return jsonify(compute_recommendation())
 
 if __name__ == '__main__':
     load_players()
@@ -274,4 +332,7 @@ if __name__ == '__main__':
     import webbrowser
     webbrowser.open('http://localhost:5000')
     
-    app.run(port=5000, debug=False)
\ No newline at end of file
+    if serve is not None:
+        serve(app, host='127.0.0.1', port=5000, threads=8)
+    else:
+        app.run(port=5000, debug=False, threaded=True)
\ No newline at end of file
@@ -4,13 +4,23 @@ ALFRED - Real Database Version
 This actually uses your PostgreSQL database with real player data
 """
 
+import gzip
 import http.server
 import socketserver
 import json
+import threading
 import webbrowser
 import psycopg2
+import psycopg2.pool
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from urllib.parse import urlparse, parse_qs
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 PORT = 9000
 
 # Database connection
@@ -20,112 +30,231 @@ DB_CONFIG = {
     'database': 'fantasy_draft_db'
 }
 
-# Draft state
-drafted_player_ids = set()
-my_team = []
-all_picks = []
-current_pick = 1
+EVENT_KEEPALIVE_SECONDS = 15
+
+@dataclass
+class DraftState:
+    """Everything that changes as picks are made, guarded by one lock"""
+    drafted_player_ids: set = field(default_factory=set)
+    my_team: list = field(default_factory=list)
+    all_picks: list = field(default_factory=list)
+    current_pick: int = 1
+    position_counts: dict = field(default_factory=dict)  # kept in step with my_team
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+    changed: threading.Condition = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Notified after each pick; shares the state lock
+        self.changed = threading.Condition(self.lock)
+    
+    def draft(self, player):
+        """Add player to my team; returns False if they were already drafted"""
+        with self.lock:
+            if player['id'] in self.drafted_player_ids:
+                return False
+            self.drafted_player_ids.add(player['id'])
+            self.my_team.append(player)
+            self.position_counts[player['pos']] = self.position_counts.get(player['pos'], 0) + 1
+            self.all_picks.append({
+                'pick': self.current_pick,
+                'name': player['name'],
+                'pos': player['pos']
+            })
+            self.current_pick += 1
+            self.changed.notify_all()
+            return True
+    
+    def snapshot(self):
+        """Copy of the state that can be read without holding the lock"""
+        with self.lock:
+            return DraftState(
+                drafted_player_ids=set(self.drafted_player_ids),
+                my_team=list(self.my_team),
+                all_picks=list(self.all_picks),
+                current_pick=self.current_pick,
+                position_counts=dict(self.position_counts)
+            )
+
+STATE = DraftState()
+
+# The player pool doesn't change during a session, so it's loaded once
+_PLAYERS_CACHE = None
+_PLAYERS_BY_ID = {}
+_PLAYERS_BY_POS = {}
+_PLAYER_JSON = {}  # player id -> pre-encoded JSON object
+_PLAYERS_CACHE_LOCK = threading.Lock()
+
+# Warm connections shared across requests; created on first use
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+def dump_json(obj):
+    """Encode obj to JSON bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def get_db_pool():
+    """Get the shared connection pool, creating it on first use"""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = psycopg2.pool.ThreadedConnectionPool(1, 16, **DB_CONFIG)
+    return _POOL
 
 def get_db_connection():
-    """Get database connection"""
-    return psycopg2.connect(**DB_CONFIG)
+    """Get database connection from the pool; hand it back with release_db_connection()"""
+    return get_db_pool().getconn()
 
-def get_top_players_by_position():
-    """Get the best players by position from database"""
+def release_db_connection(conn):
+    """Return a connection obtained from get_db_connection() to the pool"""
+    get_db_pool().putconn(conn)
+
+@contextmanager
+def db_cursor():
+    """Yield a cursor on a pooled connection, committing and returning it on exit"""
     conn = get_db_connection()
-    cur = conn.cursor()
-    
-    players = []
-    
-    # Get top players by position (simplified ranking)
+    try:
+        with conn.cursor() as cur:
+            yield cur
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        release_db_connection(conn)
+
+def get_top_players_by_position():
+    """Get the best players by position, querying the database only on first use"""
+    global _PLAYERS_CACHE, _PLAYERS_BY_ID, _PLAYERS_BY_POS, _PLAYER_JSON
+    if _PLAYERS_CACHE is None:
+        with _PLAYERS_CACHE_LOCK:
+            if _PLAYERS_CACHE is None:
+                players = load_top_players_by_position()
+                _PLAYERS_BY_ID = {p['id']: p for p in players}
+                _PLAYER_JSON = {p['id']: dump_json(p) for p in players}
+                _PLAYERS_BY_POS = {}
+                for p in players:
+                    _PLAYERS_BY_POS.setdefault(p['pos'], []).append(p)
+                _PLAYERS_CACHE = players
+    return _PLAYERS_CACHE
+
+def get_player_by_id(player_id):
+    """Look up a player in the cached pool, or None if they aren't in it"""
+    get_top_players_by_position()
+    return _PLAYERS_BY_ID.get(player_id)
+
+def invalidate_players_cache():
+    """Force the next get_top_players_by_position() call to reload from the database"""
+    global _PLAYERS_CACHE, _PLAYERS_BY_ID, _PLAYERS_BY_POS, _PLAYER_JSON
+    with _PLAYERS_CACHE_LOCK:
+        _PLAYERS_CACHE = None
+        _PLAYERS_BY_ID = {}
+        _PLAYERS_BY_POS = {}
+        _PLAYER_JSON = {}
+
+def load_top_players_by_position():
+    """Get the top 100 players by their best expert position rank from database"""
     positions = ['QB', 'RB', 'WR', 'TE']
     
-    for pos in positions:
+    # Rank and trim server-side so only the 100 draftable rows come back;
+    # ties on rank keep the QB/RB/WR/TE position priority
+    with db_cursor() as cur:
         cur.execute("""
-            SELECT player_id, name, position, team 
-            FROM players 
-            WHERE position = %s 
-            AND name NOT LIKE '%%DST%%'
-            ORDER BY name
-            LIMIT 50
-        """, (pos,))
+            SELECT p.player_id, p.name, p.position, p.team, pr.position_rank
+            FROM players p
+            JOIN LATERAL (
+                SELECT position_rank
+                FROM player_rankings
+                WHERE player_id = p.player_id
+                ORDER BY position_rank
+                LIMIT 1
+            ) pr ON true
+            WHERE p.position = ANY(%s)
+            ORDER BY pr.position_rank, array_position(%s, p.position::text), p.name
+            LIMIT 100
+        """, (positions, positions))
         
-        position_players = cur.fetchall()
-        for i, p in enumerate(position_players):
-            players.append({
-                'id': p[0],
-                'name': p[1],
-                'pos': p[2], 
-                'team': p[3],
-                'adp': i + 1  # Simple ranking for now
-            })
-    
-    cur.close()
-    conn.close()
-    
-    # Sort by a simple fantasy relevance (QBs and top RBs/WRs first)
-    def sort_key(player):
-        pos_priority = {'QB': 1, 'RB': 2, 'WR': 3, 'TE': 4}
-        # Prioritize well-known players (this is a hack, but works for demo)
-        star_players = ['Josh Allen', 'Lamar Jackson', 'Christian McCaffrey', 'Austin Ekeler', 
-                       'Justin Jefferson', 'Ja\'Marr Chase', 'Travis Kelce', 'Tyreek Hill']
-        star_bonus = 0 if any(star in player['name'] for star in star_players) else 100
-        return pos_priority.get(player['pos'], 5) * 100 + star_bonus + player['adp']
-    
-    players.sort(key=sort_key)
-    return players[:100]  # Top 100 for draft
+        return [{
+            'id': p[0],
+            'name': p[1],
+            'pos': p[2], 
+            'team': p[3],
+            'adp': p[4]
+        } for p in cur.fetchall()]
 
-def get_recommendation(my_team):
-    """Get smart draft recommendation"""
-    available = [p for p in get_top_players_by_position() if p['id'] not in drafted_player_ids]
+def best_available(drafted_player_ids, position=None):
+    """First undrafted player in rank order, optionally at one position"""
+    get_top_players_by_position()
+    pool = _PLAYERS_BY_POS.get(position, ()) if position else _PLAYERS_CACHE
+    for player in pool:
+        if player['id'] not in drafted_player_ids:
+            return player
+    return None
+
+def get_recommendation(state, available):
+    """Get smart draft recommendation; available is the undrafted pool in rank order"""
     if not available:
         return None
+    best = available[0]
+    drafted = state.drafted_player_ids
     
-    # Count positions
-    position_counts = {}
-    for player in my_team:
-        pos = player['pos']
-        position_counts[pos] = position_counts.get(pos, 0) + 1
+    position_counts = state.position_counts
     
     # Draft strategy (simplified)
-    team_size = len(my_team)
+    team_size = len(state.my_team)
     
     if team_size < 2:
         # Start with RB or WR
-        rbs = [p for p in available if p['pos'] == 'RB'][:5]
-        wrs = [p for p in available if p['pos'] == 'WR'][:5]
-        best_skill = (rbs + wrs)
+        best_skill = best_available(drafted, 'RB') or best_available(drafted, 'WR')
         if best_skill:
             return {
-                'player': best_skill[0], 
+                'player': best_skill, 
                 'reason': 'Start with elite skill position player'
             }
     
     if position_counts.get('RB', 0) < 2:
-        rbs = [p for p in available if p['pos'] == 'RB']
-        if rbs:
+        rb = best_available(drafted, 'RB')
+        if rb:
             return {
-                'player': rbs[0], 
+                'player': rb, 
                 'reason': f'Need RB ({position_counts.get("RB", 0)}/2)'
             }
     
     if position_counts.get('WR', 0) < 2:
-        wrs = [p for p in available if p['pos'] == 'WR']
-        if wrs:
+        wr = best_available(drafted, 'WR')
+        if wr:
             return {
-                'player': wrs[0], 
+                'player': wr, 
                 'reason': f'Need WR ({position_counts.get("WR", 0)}/2)'
             }
     
     if position_counts.get('QB', 0) == 0 and team_size >= 4:
-        qbs = [p for p in available if p['pos'] == 'QB']
-        if qbs:
+        qb = best_available(drafted, 'QB')
+        if qb:
             return {
-                'player': qbs[0], 
+                'player': qb, 
                 'reason': 'Time to get your QB'
             }
     
-    return {'player': available[0], 'reason': 'Best available'}
+    return {'player': best, 'reason': 'Best available'}
+
+def build_state_json():
+    """Encode the draft state sent to the page"""
+    state = STATE.snapshot()
+    available = [p for p in get_top_players_by_position() if p['id'] not in state.drafted_player_ids]
+    
+    # The player objects never change, so splice their cached JSON into the
+    # response and only encode the small per-request fields
+    data = {
+        'my_team': state.my_team,
+        'recent_picks': state.all_picks[-8:],
+        'current_pick': state.current_pick,
+        'recommendation': get_recommendation(state, available)
+    }
+    available_json = b','.join(_PLAYER_JSON[p['id']] for p in available)
+    return b'{"available":[' + available_json + b'],' + dump_json(data)[1:]
 
 HTML = """
 <!DOCTYPE html>
@@ -202,8 +331,10 @@ HTML = """
     <script>
         async function loadState() {
             const response = await fetch('/api/state');
-            const data = await response.json();
-            
+            render(await response.json());
+        }
+        
+        function render(data) {
             // Update pick info
             document.getElementById('currentPick').textContent = data.current_pick;
             document.getElementById('round').textContent = Math.ceil(data.current_pick / 12);
@@ -260,60 +391,55 @@ HTML = """
         
         async function draftPlayer(id) {
             await fetch(`/api/draft?id=${id}`);
-            loadState();
+            if (!window.EventSource) loadState();
         }
         
-        loadState();
-        setInterval(loadState, 3000);
+        // The server pushes the state on connect and after every pick
+        if (window.EventSource) {
+            new EventSource('/api/events').onmessage = e => render(JSON.parse(e.data));
+        } else {
+            loadState();
+            setInterval(loadState, 3000);
+        }
     </script>
 </body>
 </html>
 """
+HTML_BYTES = HTML.encode('utf-8')
 
 class DatabaseDraftHandler(http.server.SimpleHTTPRequestHandler):
     def do_GET(self):
-        global current_pick
         parsed_path = urlparse(self.path)
         
         if parsed_path.path == '/':
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(HTML_BYTES)))
             self.end_headers()
-            self.wfile.write(HTML.encode())
+            self.wfile.write(HTML_BYTES)
             
         elif parsed_path.path == '/api/state':
+            body = build_state_json()
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gzip.compress(body, compresslevel=1)
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
+            self.wfile.write(body)
             
-            available = [p for p in get_top_players_by_position() if p['id'] not in drafted_player_ids]
-            
-            data = {
-                'available': available,
-                'my_team': my_team,
-                'recent_picks': all_picks[-8:],
-                'current_pick': current_pick,
-                'recommendation': get_recommendation(my_team)
-            }
-            self.wfile.write(json.dumps(data).encode())
+        elif parsed_path.path == '/api/events':
+            self.stream_events()
             
         elif parsed_path.path == '/api/draft':
             params = parse_qs(parsed_path.query)
             player_id = int(params['id'][0])
             
             # Find and draft the player
-            all_players = get_top_players_by_position()
-            for player in all_players:
-                if player['id'] == player_id and player_id not in drafted_player_ids:
-                    drafted_player_ids.add(player_id)
-                    my_team.append(player)
-                    all_picks.append({
-                        'pick': current_pick,
-                        'name': player['name'],
-                        'pos': player['pos']
-                    })
-                    current_pick += 1
-                    break
+            player = get_player_by_id(player_id)
+            if player:
+                STATE.draft(player)
             
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
@@ -322,22 +448,45 @@ class DatabaseDraftHandler(http.server.SimpleHTTPRequestHandler):
         else:
             self.send_error(404)
             
+    def stream_events(self):
+        """Server-Sent Events: push the state now and again whenever a pick is made"""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        
+        sent_pick = None
+        try:
+            while True:
+                with STATE.changed:
+                    changed = STATE.changed.wait_for(lambda: STATE.current_pick != sent_pick,
+                                                     timeout=EVENT_KEEPALIVE_SECONDS)
+                    sent_pick = STATE.current_pick
+                if changed:
+                    self.wfile.write(b'data: ' + build_state_json() + b'\n\n')
+                else:
+                    self.wfile.write(b': keep-alive\n\n')  # also detects closed tabs
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+    
     def log_message(self, format, *args):
         pass
 
+class ThreadedDraftServer(socketserver.ThreadingTCPServer):
+    """Handle each request on its own thread so a slow client doesn't block other pollers"""
+    daemon_threads = True
+
 if __name__ == '__main__':
     print("🏈 ALFRED - Database Draft Assistant")
     print("=" * 50)
     
     # Test database connection
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute("SELECT COUNT(*) FROM players WHERE position IN ('QB','RB','WR','TE')")
-        player_count = cur.fetchone()[0]
+        with db_cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM players WHERE position IN ('QB','RB','WR','TE')")
+            player_count = cur.fetchone()[0]
         print(f"✅ Connected to database with {player_count} fantasy players")
-        cur.close()
-        conn.close()
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         exit(1)
@@ -348,7 +497,7 @@ if __name__ == '__main__':
     
     webbrowser.open(f'http://localhost:{PORT}')
     
-    with socketserver.TCPServer(("", PORT), DatabaseDraftHandler) as httpd:
+    with ThreadedDraftServer(("", PORT), DatabaseDraftHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -24,7 +24,7 @@ def add_adp_projections_tables():
     conn = get_db_connection()
     cur = conn.cursor()
     
-    # Create ADP data table
+    # Create both tables and their indexes in one round trip and one transaction
     cur.execute("""
         CREATE TABLE IF NOT EXISTS player_adp (
             adp_id SERIAL PRIMARY KEY,
@@ -35,10 +35,7 @@ def add_adp_projections_tables():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UNIQUE(player_id, source_id, data_date)
         );
-    """)
-    
-    # Create projections data table
-    cur.execute("""
+        
         CREATE TABLE IF NOT EXISTS player_projections (
             projection_id SERIAL PRIMARY KEY,
             player_id INTEGER REFERENCES players(player_id),
@@ -49,17 +46,14 @@ def add_adp_projections_tables():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UNIQUE(player_id, source_id, projection_type, data_date)
         );
+        
+        -- Indexes for better performance
+        CREATE INDEX IF NOT EXISTS idx_player_adp_player_id ON player_adp(player_id);
+        CREATE INDEX IF NOT EXISTS idx_player_adp_source_id ON player_adp(source_id);
+        CREATE INDEX IF NOT EXISTS idx_player_projections_player_id ON player_projections(player_id);
+        CREATE INDEX IF NOT EXISTS idx_player_projections_source_id ON player_projections(source_id);
     """)
     
-    # Create indexes for better performance
-    try:
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_player_adp_player_id ON player_adp(player_id);")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_player_adp_source_id ON player_adp(source_id);")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_player_projections_player_id ON player_projections(player_id);")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_player_projections_source_id ON player_projections(source_id);")
-    except Exception as e:
-        print(f"⚠️  Note: Some indexes may already exist: {e}")
-    
     conn.commit()
     cur.close()
     conn.close()
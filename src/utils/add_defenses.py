@@ -3,6 +3,7 @@
 Add team defenses (DST) to the database
 """
 import psycopg2
+from psycopg2.extras import execute_values
 import os
 
 def add_team_defenses():
@@ -67,42 +68,32 @@ def add_team_defenses():
         
         cur = conn.cursor()
         
-        # Add DST for each team
-        inserted_count = 0
+        # Add DST for each team in a single round trip
+        rows = [
+            (f"{team_names.get(team_code, f'{team_code} Defense')} DST", 'DST', team_code, 2025, True)
+            for team_code in nfl_teams
+        ]
+        # Defenses already in the table are skipped by the (name, team, year) unique key
+        inserted = execute_values(cur, """
+            INSERT INTO players (name, position, team, year, is_active)
+            VALUES %s
+            ON CONFLICT (name, team, year) DO NOTHING
+            RETURNING name
+        """, rows, page_size=100, fetch=True)
         
-        for team_code in nfl_teams:
-            team_name = team_names.get(team_code, f"{team_code} Defense")
-            defense_name = f"{team_name} DST"
-            
-            try:
-                cur.execute("""
-                    INSERT INTO players (name, position, team, year, is_active)
-                    VALUES (%s, %s, %s, %s, %s);
-                """, (defense_name, 'DST', team_code, 2025, True))
-                
-                print(f"  ✅ Added: {defense_name}")
-                inserted_count += 1
-                
-            except Exception as e:
-                print(f"  ❌ Error adding {defense_name}: {e}")
-                continue
+        for (defense_name,) in inserted:
+            print(f"  ✅ Added: {defense_name}")
+        inserted_count = len(inserted)
+        
+        skipped_count = len(rows) - inserted_count
+        if skipped_count:
+            print(f"  ⏭️  Skipped {skipped_count} defenses already in the database")
         
         conn.commit()
-        cur.close()
-        conn.close()
         
         print(f"\n✅ Successfully added {inserted_count} team defenses!")
         
         # Show updated counts
-        conn = psycopg2.connect(
-            host='localhost',
-            port='5432',
-            user=os.environ.get('USER', 'jeffgreenfield'),
-            password='',
-            database='fantasy_draft_db'
-        )
-        
-        cur = conn.cursor()
         cur.execute("""
             SELECT position, COUNT(*) as count
             FROM players 
@@ -47,21 +47,24 @@ def check_adp_data():
         for source in adp_sources:
             print(f"  {source[0]}")
         
-        # Check a sample of data
-        cur.execute("""
-            SELECT p.name, p.position, rs.source_name, pr.position_rank
-            FROM players p
-            JOIN player_rankings pr ON p.player_id = pr.player_id
-            JOIN ranking_sources rs ON pr.source_id = rs.source_id
-            WHERE rs.source_name ILIKE '%underdog%'
-            AND p.position = 'QB'
-            ORDER BY pr.position_rank
-            LIMIT 10;
-        """)
-        
-        print(f"\nSample Underdog data (potential ADP):")
-        for name, pos, source, rank in cur.fetchall():
-            print(f"  {rank:2d}. {name} ({pos}) - {source}")
+        # Check a sample of data; a server-side cursor streams the rows in
+        # itersize batches so this stays cheap if the sample grows
+        with conn.cursor(name='adp_scan') as scan:
+            scan.itersize = 2000
+            scan.execute("""
+                SELECT p.name, p.position, rs.source_name, pr.position_rank
+                FROM players p
+                JOIN player_rankings pr ON p.player_id = pr.player_id
+                JOIN ranking_sources rs ON pr.source_id = rs.source_id
+                WHERE rs.source_name ILIKE '%underdog%'
+                AND p.position = 'QB'
+                ORDER BY pr.position_rank
+                LIMIT 10;
+            """)
+            
+            print(f"\nSample Underdog data (potential ADP):")
+            for name, pos, source, rank in scan:
+                print(f"  {rank:2d}. {name} ({pos}) - {source}")
             
     except Exception as e:
         print(f"Error: {e}")
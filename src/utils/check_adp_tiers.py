@@ -16,6 +16,15 @@ def get_db_connection():
         database='fantasy_draft_db'
     )
 
+# (heading, start, end) slices of the ADP-ordered top 25; tiers overlap on purpose
+# because each one is the pool likely to be available at that draft slot
+DRAFT_TIERS = [
+    ("TIER 1 (Pick 1) - Top 3", 0, 3),
+    ("TIER 2 (Picks 2-5) - Top 9", 0, 9),
+    ("TIER 3 (Picks 6-9) - Players 6-15", 5, 15),
+    ("TIER 4 (Pick 10) - Players 10-20", 9, 20),
+]
+
 def check_adp_tiers():
     """Check top ADP players for tier planning"""
     conn = get_db_connection()
@@ -45,23 +54,12 @@ def check_adp_tiers():
         print(f"{rank:<5} {name:<25} {pos:<4} {team:<4} {mean_adp:>6.1f}")
     
     # Group by tiers based on user's suggestions
-    print("\n\nDRAFT POSITION TIERS:\n")
-    
-    print("TIER 1 (Pick 1) - Top 3:")
-    for i, (name, pos, team, rank, mean_adp) in enumerate(players[:3]):
-        print(f"  {name} ({pos}) - ADP: {mean_adp:.1f}")
-    
-    print("\nTIER 2 (Picks 2-5) - Top 9:")
-    for i, (name, pos, team, rank, mean_adp) in enumerate(players[:9]):
-        print(f"  {name} ({pos}) - ADP: {mean_adp:.1f}")
-    
-    print("\nTIER 3 (Picks 6-9) - Players 6-15:")
-    for i, (name, pos, team, rank, mean_adp) in enumerate(players[5:15]):
-        print(f"  {name} ({pos}) - ADP: {mean_adp:.1f}")
+    print("\n\nDRAFT POSITION TIERS:")
     
-    print("\nTIER 4 (Pick 10) - Players 10-20:")
-    for i, (name, pos, team, rank, mean_adp) in enumerate(players[9:20]):
-        print(f"  {name} ({pos}) - ADP: {mean_adp:.1f}")
+    for label, start, end in DRAFT_TIERS:
+        print(f"\n{label}:")
+        for name, pos, team, rank, mean_adp in players[start:end]:
+            print(f"  {name} ({pos}) - ADP: {mean_adp:.1f}")
     
     cur.close()
     conn.close()
@@ -4,24 +4,38 @@ Simple Database Data Checker
 Check and fix player team assignments
 """
 import psycopg2
+import psycopg2.pool
+from psycopg2.extras import execute_batch
+from collections import defaultdict
 import pandas as pd
 import os
 
+# One pool for every check in this run, created on first use
+_POOL = None
+
 def connect_to_db():
     """Connect to PostgreSQL database"""
+    global _POOL
     try:
-        conn = psycopg2.connect(
-            host='localhost',
-            port='5432',
-            user=os.environ.get('USER', 'jeffgreenfield'),
-            password='',
-            database='fantasy_draft_db'
-        )
-        return conn
+        if _POOL is None:
+            _POOL = psycopg2.pool.SimpleConnectionPool(
+                1, 4,
+                host='localhost',
+                port='5432',
+                user=os.environ.get('USER', 'jeffgreenfield'),
+                password='',
+                database='fantasy_draft_db'
+            )
+        return _POOL.getconn()
     except Exception as e:
         print(f"❌ Error connecting to database: {e}")
         return None
 
+def release_db_connection(conn):
+    """Return a connection from connect_to_db() to the pool"""
+    conn.rollback()  # don't hand back a connection with an open transaction
+    _POOL.putconn(conn)
+
 def check_player_teams():
     """Check player team assignments"""
     conn = connect_to_db()
@@ -54,14 +68,17 @@ def check_player_teams():
     
     issues_found = []
     
+    # Fetch every candidate in one query, then match each player client-side
+    cur.execute("""
+        SELECT player_id, name, team FROM players 
+        WHERE name ILIKE ANY(%s);
+    """, ([f"%{player_name}%" for player_name in correct_teams],))
+    candidates = [(row, row[1].lower()) for row in cur.fetchall()]
+    
     # Check each player
     for player_name, correct_team in correct_teams.items():
-        cur.execute("""
-            SELECT player_id, name, team FROM players 
-            WHERE name ILIKE %s;
-        """, (f"%{player_name}%",))
-        
-        result = cur.fetchone()
+        player_name_lower = player_name.lower()
+        result = next((row for row, name_lower in candidates if player_name_lower in name_lower), None)
         if result:
             player_id, name, current_team = result
             if current_team != correct_team:
@@ -78,12 +95,13 @@ def check_player_teams():
         fix_prompt = input("Fix these issues? (y/n): ").lower().strip()
         
         if fix_prompt == 'y':
+            # Send all the updates in batched round trips
+            execute_batch(cur, """
+                UPDATE players 
+                SET team = %s, updated_at = CURRENT_TIMESTAMP
+                WHERE player_id = %s;
+            """, [(new_team, player_id) for player_id, _, _, new_team in issues_found], page_size=50)
             for player_id, name, old_team, new_team in issues_found:
-                cur.execute("""
-                    UPDATE players 
-                    SET team = %s, updated_at = CURRENT_TIMESTAMP
-                    WHERE player_id = %s;
-                """, (new_team, player_id))
                 print(f"✅ Updated {name}: {old_team} → {new_team}")
             
             conn.commit()
@@ -94,7 +112,7 @@ def check_player_teams():
         print("✅ No team assignment issues found!")
     
     cur.close()
-    conn.close()
+    release_db_connection(conn)
 
 def show_all_players():
     """Show all players by position"""
@@ -109,24 +127,38 @@ def show_all_players():
     
     positions = ['QB', 'RB', 'WR', 'TE']
     
+    # One round trip for all positions: the first 10 names of each, with the
+    # position total carried on every row
+    cur.execute("""
+        SELECT position, name, team, total FROM (
+            SELECT position, name, team,
+                   ROW_NUMBER() OVER (PARTITION BY position ORDER BY name) AS rn,
+                   COUNT(*) OVER (PARTITION BY position) AS total
+            FROM players
+            WHERE position = ANY(%s)
+        ) ranked
+        WHERE rn <= 10
+        ORDER BY position, rn;
+    """, (positions,))
+    
+    players_by_pos = defaultdict(list)
+    totals = {}
+    for pos, name, team, total in cur.fetchall():
+        players_by_pos[pos].append((name, team))
+        totals[pos] = total
+    
     for pos in positions:
-        cur.execute("""
-            SELECT name, team FROM players 
-            WHERE position = %s 
-            ORDER BY name;
-        """, (pos,))
-        
-        players = cur.fetchall()
-        print(f"\n{pos} ({len(players)} players):")
+        total = totals.get(pos, 0)
+        print(f"\n{pos} ({total} players):")
         
-        for name, team in players[:10]:  # Show first 10
+        for name, team in players_by_pos[pos]:
             print(f"  {name} ({team})")
         
-        if len(players) > 10:
-            print(f"  ... and {len(players) - 10} more")
+        if total > 10:
+            print(f"  ... and {total - 10} more")
     
     cur.close()
-    conn.close()
+    release_db_connection(conn)
 
 def show_rankings_summary():
     """Show rankings summary"""
@@ -161,7 +193,7 @@ def show_rankings_summary():
     print(f"\nTotal: {player_count} players, {ranking_count} rankings")
     
     cur.close()
-    conn.close()
+    release_db_connection(conn)
 
 if __name__ == "__main__":
     print("🏈 DATABASE DATA CHECKER")
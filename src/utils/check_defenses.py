@@ -2,35 +2,43 @@
 """
 Check the defenses in the Excel file
 """
+import sys
 import pandas as pd
 
+# All 32 NFL teams, used to check the sheet's coverage
+EXPECTED_TEAMS = frozenset([
+    'BUF', 'MIA', 'NE', 'NYJ', 'BAL', 'CIN', 'CLE', 'PIT',
+    'HOU', 'IND', 'JAX', 'TEN', 'DEN', 'KC', 'LV', 'LAC',
+    'DAL', 'NYG', 'PHI', 'WAS', 'CHI', 'DET', 'GB', 'MIN',
+    'ATL', 'CAR', 'NO', 'TB', 'ARI', 'LAR', 'SF', 'SEA'
+])
+
 def check_defenses():
     print("🛡️ CHECKING DEFENSES IN EXCEL FILE")
     print("=" * 40)
     
     try:
-        # Read the D/ST sheet
+        # Read the D/ST sheet; only the two columns we report on get parsed
         df = pd.read_excel('/Users/jeffgreenfield/dev/ff_draft_vibe/FF_2025_Complete_Rankings.xlsx', 
-                           sheet_name='D_ST_Rankings')
+                           sheet_name='D_ST_Rankings', engine='openpyxl',
+                           usecols=['Player_Name', 'Team'])
         
         print(f"📊 Found {len(df)} defenses in Excel file")
         print("\n🛡️ Defense teams:")
         
-        for i, row in df.iterrows():
-            print(f"  {i+1:2d}. {row['Player_Name']} - {row['Team']}")
+        # Collect the listing and write it in one go
+        out = [f"  {i:2d}. {name} - {team}"
+               for i, (name, team) in enumerate(df[['Player_Name', 'Team']].itertuples(index=False, name=None), 1)]
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         # Check if all 32 NFL teams are represented
-        teams = set(df['Team'].unique())
+        teams = set(df['Team'].tolist())
         print(f"\n📋 Unique teams: {len(teams)}")
-        print(f"Teams: {sorted(list(teams))}")
+        print(f"Teams: {sorted(teams)}")
         
         # Check for missing major teams
-        expected_teams = ['BUF', 'MIA', 'NE', 'NYJ', 'BAL', 'CIN', 'CLE', 'PIT', 
-                         'HOU', 'IND', 'JAX', 'TEN', 'DEN', 'KC', 'LV', 'LAC',
-                         'DAL', 'NYG', 'PHI', 'WAS', 'CHI', 'DET', 'GB', 'MIN',
-                         'ATL', 'CAR', 'NO', 'TB', 'ARI', 'LAR', 'SF', 'SEA']
-        
-        missing_teams = set(expected_teams) - teams
+        missing_teams = EXPECTED_TEAMS - teams
         if missing_teams:
             print(f"❌ Missing teams: {sorted(list(missing_teams))}")
         else:
@@ -2,53 +2,63 @@
 """
 Debug defense/D/ST data from Sleeper API
 """
-import requests
-import json
+import re
+from sleeper_players import load_sleeper_players
+
+# Sleeper position labels used for team defenses
+DEF_POSITIONS = frozenset(['DEF', 'D/ST', 'DST'])
+
+# Any position that might be a defense: contains D (covers DEF, D/ST, DST) or ST
+DEFENSE_LIKE_PATTERN = re.compile(r'D|ST')
 
 def debug_defenses():
     print("🔍 DEBUGGING DEFENSE DATA FROM SLEEPER API")
     print("=" * 50)
     
     try:
-        url = "https://api.sleeper.app/v1/players/nfl"
-        response = requests.get(url)
+        all_players = load_sleeper_players()
         
-        if response.status_code == 200:
-            all_players = response.json()
+        if all_players is not None:
             print(f"✅ Loaded {len(all_players)} total players")
             
-            # Look for defenses
+            # Look for defenses, and collect kickers for comparison, in one pass
             defenses = []
-            defense_positions = []
+            defense_positions = {}  # insertion-ordered set
+            kickers = []
             
             for player_id, player_data in all_players.items():
-                position = player_data.get('position', '')
-                team = player_data.get('team', '')
-                name = player_data.get('full_name', '')
+                position = player_data.get('position')
+                if not position:
+                    continue
                 
                 # Check for any defense-related positions
-                if position and ('DEF' in position or 'D/ST' in position or position == 'DST'):
+                if position in DEF_POSITIONS:
                     defenses.append({
                         'id': player_id,
-                        'name': name,
+                        'name': player_data.get('full_name', ''),
                         'position': position,
-                        'team': team,
+                        'team': player_data.get('team', ''),
                         'status': player_data.get('status', ''),
                         'data': player_data
                     })
+                elif position == 'K':
+                    kickers.append({
+                        'name': player_data.get('full_name', ''),
+                        'team': player_data.get('team', ''),
+                        'status': player_data.get('status', '')
+                    })
                 
                 # Track all unique positions that might be defense
-                if position and ('D' in position or 'DEF' in position or 'ST' in position):
-                    if position not in defense_positions:
-                        defense_positions.append(position)
+                if DEFENSE_LIKE_PATTERN.search(position):
+                    defense_positions[position] = None
             
-            print(f"\n📊 Defense-related positions found: {defense_positions}")
+            print(f"\n📊 Defense-related positions found: {list(defense_positions)}")
             print(f"🛡️ Total defense entries: {len(defenses)}")
             
             if defenses:
                 print("\n🛡️ Defense entries found:")
-                for i, defense in enumerate(defenses[:10]):  # Show first 10
-                    print(f"  {i+1}. {defense['name']} ({defense['position']}) - {defense['team']}")
+                for i, defense in enumerate(defenses[:10], 1):  # Show first 10
+                    print(f"  {i}. {defense['name']} ({defense['position']}) - {defense['team']}")
             else:
                 print("\n❌ No defense entries found!")
                 
@@ -72,22 +82,10 @@ def debug_defenses():
             
             # Also check for kickers to see the pattern
             print(f"\n🦶 Checking kickers for comparison:")
-            kickers = []
-            for player_id, player_data in all_players.items():
-                if player_data.get('position') == 'K':
-                    kickers.append({
-                        'name': player_data.get('full_name', ''),
-                        'team': player_data.get('team', ''),
-                        'status': player_data.get('status', '')
-                    })
-            
             print(f"Found {len(kickers)} kickers")
             if kickers:
-                for i, kicker in enumerate(kickers[:5]):  # Show first 5
-                    print(f"  {i+1}. {kicker['name']} - {kicker['team']} ({kicker['status']})")
-            
-        else:
-            print(f"❌ Error: {response.status_code}")
+                for i, kicker in enumerate(kickers[:5], 1):  # Show first 5
+                    print(f"  {i}. {kicker['name']} - {kicker['team']} ({kicker['status']})")
             
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -1,4 +1,5 @@
 import os
+import sys
 from dotenv import load_dotenv
 from espn_api.football import League
 
@@ -37,16 +38,18 @@ def debug_league_data():
         print(f"Error accessing draft: {e}")
     
     # Check team rosters
-    print(f"\n👥 Team Roster Info:")
-    for i, team in enumerate(league.teams):
-        print(f"{i+1}. {team.team_name}")
-        print(f"   Roster size: {len(team.roster)}")
+    # Collect the roster report and write it in one go
+    out = [f"\n👥 Team Roster Info:"]
+    for i, team in enumerate(league.teams, 1):
+        out.append(f"{i}. {team.team_name}")
+        out.append(f"   Roster size: {len(team.roster)}")
         if team.roster:
-            print(f"   Sample players: {[p.name for p in team.roster[:3]]}")
+            out.append(f"   Sample players: {[p.name for p in team.roster[:3]]}")
             # Check acquisition types
             acq_types = [getattr(p, 'acquisition_type', 'Unknown') for p in team.roster[:5]]
-            print(f"   Acquisition types: {set(acq_types)}")
-        print()
+            out.append(f"   Acquisition types: {set(acq_types)}")
+        out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Try to access draft picks directly
     print(f"📊 Attempting to access draft picks...")
@@ -54,8 +57,8 @@ def debug_league_data():
         # Method 1: league.draft
         if hasattr(league, 'draft') and league.draft:
             print(f"Draft method 1 - league.draft: {len(league.draft)} picks")
-            for i, pick in enumerate(league.draft[:5]):
-                print(f"   Pick {i+1}: {pick}")
+            for i, pick in enumerate(league.draft[:5], 1):
+                print(f"   Pick {i}: {pick}")
     except Exception as e:
         print(f"Method 1 failed: {e}")
     
@@ -68,8 +71,7 @@ def debug_league_data():
     
     # Check available league attributes
     print(f"\n🔧 Available league attributes:")
-    attrs = [attr for attr in dir(league) if not attr.startswith('_')]
-    draft_related = [attr for attr in attrs if 'draft' in attr.lower()]
+    draft_related = [attr for attr in dir(league) if not attr.startswith('_') and 'draft' in attr.lower()]
     print(f"Draft-related attributes: {draft_related}")
     
     return league
@@ -2,6 +2,7 @@
 """
 Debug the scarcity calculation issue
 """
+import bisect
 import sys
 sys.path.append('/Users/jeffgreenfield/dev/ff_draft_vibe')
 
@@ -21,37 +22,41 @@ def debug_scarcity():
     print("🔍 DEBUGGING POSITIONAL SCARCITY CALCULATION")
     print("=" * 60)
     
+    # Look up each RB's expert data once instead of once per pair
+    expert_data = {rb['player_id']: assistant.get_player_expert_data(rb) for rb in sample_rbs}
+    
+    # Ranked RBs in sample order, plus the same list sorted by ranking; neither
+    # depends on the RB being debugged, so build them once
+    all_rb_data = []
+    for other_rb in sample_rbs:
+        other_consensus, _, _, _ = expert_data[other_rb['player_id']]
+        if other_consensus < 999:
+            all_rb_data.append({
+                'name': other_rb['name'],
+                'consensus': other_consensus
+            })
+    sorted_rb_data = sorted(all_rb_data, key=lambda x: x['consensus'])
+    sorted_ranks = [data['consensus'] for data in sorted_rb_data]
+    sorted_names = [f"{data['name']} (#{data['consensus']})" for data in sorted_rb_data]
+    
     for rb in sample_rbs:
         print(f"\n🎯 {rb['name']} ({rb['position']}) - {rb['team']}")
         print("-" * 40)
         
         # Get his ranking
-        consensus, high, low, std = assistant.get_player_expert_data(rb)
+        consensus, high, low, std = expert_data[rb['player_id']]
         print(f"His rank: #{consensus}")
         
         # Get all RB rankings
         print("All RBs available:")
-        all_rb_data = []
-        for other_rb in sample_rbs:
-            other_consensus, _, _, _ = assistant.get_player_expert_data(other_rb)
-            if other_consensus < 999:
-                all_rb_data.append({
-                    'name': other_rb['name'],
-                    'consensus': other_consensus
-                })
-                print(f"  {other_rb['name']}: #{other_consensus}")
+        for data in all_rb_data:
+            print(f"  {data['name']}: #{data['consensus']}")
         
-        # Sort by ranking
-        all_rb_data.sort(key=lambda x: x['consensus'])
-        sorted_names = [f"{rb['name']} (#{rb['consensus']})" for rb in all_rb_data]
         print(f"Sorted order: {sorted_names}")
         
-        # Find next player manually
-        next_player = None
-        for other_data in all_rb_data:
-            if other_data['consensus'] > consensus:
-                next_player = other_data
-                break
+        # Find next player: the first ranking strictly worse than his
+        next_index = bisect.bisect_right(sorted_ranks, consensus)
+        next_player = sorted_rb_data[next_index] if next_index < len(sorted_rb_data) else None
         
         if next_player:
             drop_off = next_player['consensus'] - consensus
@@ -1,14 +1,55 @@
+import io
+import sys
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
+# (connect, read) timeout for Sleeper API calls, in seconds
+SLEEPER_TIMEOUT = (3.05, 15)
+
+def load_json(data):
+    """Decode JSON bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class SleeperDraftDebugger:
     def __init__(self, draft_id, user_id="352200144369963008"):
         self.draft_id = draft_id
         self.user_id = user_id
+        self.draft_url = f"https://api.sleeper.app/v1/draft/{draft_id}"
+        self.picks_url = f"https://api.sleeper.app/v1/draft/{draft_id}/picks"
+        self._slot_to_user = None  # draft slot -> user id, built once from draft_order
+        
+        # One keep-alive session so the draft and picks calls share a connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                              max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=[429, 500, 502, 503, 504]))
+        self.session.mount('https://', adapter)
         
     def debug_draft_structure(self):
         """Comprehensive debug of Sleeper draft structure"""
+        # Collect the whole report and write it in one go
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                self._debug_draft_structure()
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    
+    def _debug_draft_structure(self):
         print("🔍 SLEEPER DRAFT STRUCTURE DEBUG")
         print("=" * 60)
         print(f"Draft ID: {self.draft_id}")
@@ -16,24 +57,30 @@ class SleeperDraftDebugger:
         print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print()
         
-        # 1. Get draft info
-        print("1️⃣ DRAFT INFO ANALYSIS")
-        print("-" * 30)
-        draft_info = self.get_draft_info()
-        
-        if not draft_info:
-            print("❌ Failed to get draft info - stopping debug")
-            return
-        
-        # 2. Analyze draft order structure
-        print("\n2️⃣ DRAFT ORDER ANALYSIS")
-        print("-" * 30)
-        self.analyze_draft_order(draft_info)
+        # The picks don't depend on the draft info, so fetch them in the
+        # background while the draft info is fetched and analyzed
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            picks_request = executor.submit(self.session.get, self.picks_url, timeout=SLEEPER_TIMEOUT)
+            
+            # 1. Get draft info
+            print("1️⃣ DRAFT INFO ANALYSIS")
+            print("-" * 30)
+            draft_info = self.get_draft_info()
+            
+            if not draft_info:
+                print("❌ Failed to get draft info - stopping debug")
+                return
+            
+            # 2. Analyze draft order structure
+            print("\n2️⃣ DRAFT ORDER ANALYSIS")
+            print("-" * 30)
+            self.analyze_draft_order(draft_info)
+            
+            # 3. Get and analyze picks
+            print("\n3️⃣ PICKS ANALYSIS")
+            print("-" * 30)
+            picks = self.get_picks(picks_request)
         
-        # 3. Get and analyze picks
-        print("\n3️⃣ PICKS ANALYSIS")
-        print("-" * 30)
-        picks = self.get_picks()
         if picks:
             self.analyze_picks(picks, draft_info)
         
@@ -51,8 +98,8 @@ class SleeperDraftDebugger:
     def get_draft_info(self):
         """Get draft information with detailed structure analysis"""
         try:
-            url = f"https://api.sleeper.app/v1/draft/{self.draft_id}"
-            response = requests.get(url)
+            url = self.draft_url
+            response = self.session.get(url, timeout=SLEEPER_TIMEOUT)
             
             print(f"📡 API Call: {url}")
             print(f"🌐 Status Code: {response.status_code}")
@@ -63,7 +110,7 @@ class SleeperDraftDebugger:
                     print("   Draft not found - check the draft ID")
                 return None
             
-            draft_data = response.json()
+            draft_data = load_json(response.content)
             
             # Show overall structure
             print(f"✅ Draft data received")
@@ -98,6 +145,7 @@ class SleeperDraftDebugger:
             return
         
         if isinstance(draft_order, dict):
+            self._slot_to_user = {team_id: user_id for user_id, team_id in draft_order.items()}
             print(f"📊 draft_order is a dict with {len(draft_order)} entries:")
             for user_id, team_id in draft_order.items():
                 is_you = "👤 (YOU!)" if user_id == self.user_id else ""
@@ -120,11 +168,14 @@ class SleeperDraftDebugger:
                 value = draft_info[key]
                 print(f"   {key}: {type(value)} = {value}")
     
-    def get_picks(self):
-        """Get draft picks with analysis"""
+    def get_picks(self, request=None):
+        """Get draft picks with analysis; request is an optional in-flight future for the response"""
         try:
-            url = f"https://api.sleeper.app/v1/draft/{self.draft_id}/picks"
-            response = requests.get(url)
+            url = self.picks_url
+            if request is not None:
+                response = request.result()
+            else:
+                response = self.session.get(url, timeout=SLEEPER_TIMEOUT)
             
             print(f"📡 API Call: {url}")
             print(f"🌐 Status Code: {response.status_code}")
@@ -133,7 +184,7 @@ class SleeperDraftDebugger:
                 print(f"❌ Error getting picks: {response.status_code}")
                 return None
             
-            picks = response.json()
+            picks = load_json(response.content)
             print(f"✅ Got {len(picks)} picks")
             
             return picks
@@ -177,21 +228,14 @@ class SleeperDraftDebugger:
             print(f"   Team '{team_id}': {count} picks")
         
         # Check if picked_by matches roster_id
-        mismatches = []
-        for pick in picks:
-            picked_by = pick.get('picked_by')
-            roster_id = pick.get('roster_id')
-            if picked_by != roster_id:
-                mismatches.append({
-                    'pick_no': pick.get('pick_no'),
-                    'picked_by': picked_by,
-                    'roster_id': roster_id
-                })
+        # Only the first 5 mismatches are shown, so stop scanning once we have them
+        mismatches = list(islice(
+            (pick for pick in picks if pick.get('picked_by') != pick.get('roster_id')), 5))
         
         if mismatches:
             print(f"\n⚠️  picked_by vs roster_id mismatches:")
-            for mismatch in mismatches[:5]:
-                print(f"   Pick {mismatch['pick_no']}: picked_by='{mismatch['picked_by']}' vs roster_id='{mismatch['roster_id']}'")
+            for pick in mismatches:
+                print(f"   Pick {pick.get('pick_no')}: picked_by='{pick.get('picked_by')}' vs roster_id='{pick.get('roster_id')}'")
         else:
             print(f"✅ picked_by and roster_id match for all picks")
     
@@ -256,8 +300,8 @@ class SleeperDraftDebugger:
                 print(f"   ❌ No picks found for user {self.user_id}")
                 
                 # Show who did make picks
-                pickers = set(p.get('picked_by') for p in picks)
-                print(f"   Teams that made picks: {sorted(list(pickers))}")
+                pickers = {p.get('picked_by') for p in picks}
+                print(f"   Teams that made picks: {sorted(pickers)}")
     
     def debug_turn_calculation(self, draft_info, picks):
         """Debug turn calculation logic"""
@@ -289,21 +333,20 @@ class SleeperDraftDebugger:
         print(f"   Current round: {current_round}")
         print(f"   Pick in round: {pick_in_round}")
         
-        # Calculate who should pick next
-        if is_snake and current_round % 2 == 0:
-            # Even rounds reverse for snake
-            next_team_slot = total_teams - pick_in_round
-        else:
-            # Odd rounds or linear draft
-            next_team_slot = pick_in_round + 1
+        # Calculate who should pick next: even rounds reverse for snake,
+        # odd rounds and linear drafts go in slot order
+        reversed_round = is_snake and not current_round & 1
+        next_team_slot = total_teams - pick_in_round if reversed_round else pick_in_round + 1
         
         print(f"   Next team slot: {next_team_slot}")
         
         # Try to map slot to actual team
         draft_order = draft_info.get('draft_order', {})
         if isinstance(draft_order, dict):
-            # Find team by slot (reverse lookup)
-            slot_to_user = {v: k for k, v in draft_order.items()}
+            # Find team by slot (reverse lookup, built when the order was analyzed)
+            if self._slot_to_user is None:
+                self._slot_to_user = {v: k for k, v in draft_order.items()}
+            slot_to_user = self._slot_to_user
             if next_team_slot in slot_to_user:
                 next_user = slot_to_user[next_team_slot]
                 is_you = next_user == self.user_id
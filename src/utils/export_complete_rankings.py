@@ -5,84 +5,104 @@ Export comprehensive fantasy football rankings using ALL players from Sleeper da
 import sys
 sys.path.append('/Users/jeffgreenfield/dev/ff_draft_vibe')
 
+from collections import Counter, defaultdict
+from functools import lru_cache
 import pandas as pd
-import requests
 from complete_sleeper_assistant import CompleteDraftAssistant
+from sleeper_players import refresh_sleeper_cache, iter_sleeper_players
+
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:  # xlsxwriter is optional; fall back to openpyxl
+    EXCEL_ENGINE = 'openpyxl'
+
+# Sleeper positions kept for the export; defenses are all reported as D/ST
+OFFENSE_POSITIONS = frozenset(['QB', 'RB', 'WR', 'TE', 'K'])
+DEFENSE_POSITIONS = frozenset(['D/ST', 'DEF'])
+REPORT_POSITIONS = ('QB', 'RB', 'WR', 'TE', 'K', 'D/ST')
 
 def get_all_fantasy_players():
     """Get all fantasy-relevant players from Sleeper database"""
     print("📥 Loading complete NFL player database from Sleeper...")
     
     try:
-        url = "https://api.sleeper.app/v1/players/nfl"
-        response = requests.get(url)
-        
-        if response.status_code == 200:
-            all_players = response.json()
-            print(f"✅ Loaded {len(all_players)} total players from Sleeper")
-            
+        if refresh_sleeper_cache():
             # Filter for fantasy-relevant players
             fantasy_players = []
-            position_counts = {'QB': 0, 'RB': 0, 'WR': 0, 'TE': 0, 'K': 0, 'D/ST': 0, 'DEF': 0}
+            position_counts = Counter()
+            total_players = 0
             
-            for player_id, player_data in all_players.items():
+            for player_id, player_data in iter_sleeper_players():
+                total_players += 1
                 position = player_data.get('position', '')
-                team = player_data.get('team', '')
-                status = player_data.get('status', 'Unknown')
-                name = player_data.get('full_name', '')
                 
-                # Include all fantasy positions
-                if position in ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST', 'DEF']:
-                    # For active players, require a team and name
-                    if position in ['QB', 'RB', 'WR', 'TE', 'K']:
-                        if team and team != 'FA' and name:  # Must have team, not free agent, and have name
-                            fantasy_players.append({
-                                'player_id': player_id,
-                                'name': name,
-                                'position': position,
-                                'team': team,
-                                'status': status,
-                                'age': player_data.get('age'),
-                                'years_exp': player_data.get('years_exp'),
-                                'injury_status': player_data.get('injury_status', ''),
-                                'player_data': player_data
-                            })
-                            position_counts[position] += 1
-                    
-                    # For defenses, different logic
-                    elif position in ['D/ST', 'DEF'] or position == 'DEF':
-                        if team:  # Defenses are team-based
-                            # Create proper defense name
-                            defense_name = f"{team} Defense" if team else "Unknown Defense"
-                            fantasy_players.append({
-                                'player_id': player_id,
-                                'name': defense_name,
-                                'position': 'D/ST',
-                                'team': team,
-                                'status': 'Active',
-                                'age': None,
-                                'years_exp': None,
-                                'injury_status': '',
-                                'player_data': player_data
-                            })
-                            position_counts['D/ST'] += 1
+                # For active players, require a team and name
+                if position in OFFENSE_POSITIONS:
+                    team = player_data.get('team', '')
+                    name = player_data.get('full_name', '')
+                    if team and team != 'FA' and name:  # Must have team, not free agent, and have name
+                        fantasy_players.append({
+                            'player_id': player_id,
+                            'name': name,
+                            'position': position,
+                            'team': team,
+                            'status': player_data.get('status', 'Unknown'),
+                            'age': player_data.get('age'),
+                            'years_exp': player_data.get('years_exp'),
+                            'injury_status': player_data.get('injury_status', ''),
+                            'player_data': player_data
+                        })
+                        position_counts[position] += 1
+                
+                # For defenses, different logic
+                elif position in DEFENSE_POSITIONS:
+                    team = player_data.get('team', '')
+                    if team:  # Defenses are team-based
+                        fantasy_players.append({
+                            'player_id': player_id,
+                            'name': f"{team} Defense",
+                            'position': 'D/ST',
+                            'team': team,
+                            'status': 'Active',
+                            'age': None,
+                            'years_exp': None,
+                            'injury_status': '',
+                            'player_data': player_data
+                        })
+                        position_counts['D/ST'] += 1
             
+            print(f"✅ Loaded {total_players} total players from Sleeper")
             print(f"📊 Fantasy-relevant players by position:")
-            for pos, count in position_counts.items():
-                if count > 0:
-                    print(f"  {pos}: {count} players")
+            for pos in REPORT_POSITIONS:
+                if position_counts[pos] > 0:
+                    print(f"  {pos}: {position_counts[pos]} players")
             
             print(f"🎯 Total fantasy players: {len(fantasy_players)}")
             return fantasy_players
             
         else:
-            print(f"❌ Error loading players: {response.status_code}")
             return []
             
     except Exception as e:
         print(f"❌ Error: {e}")
         return []
 
+def memoize_expert_data(assistant):
+    """Cache assistant.get_player_expert_data by (name, position, team)
+    
+    The VORP scarcity step looks up every same-position player again for each
+    ranked player, so without this the same lookups are repeated many times.
+    """
+    lookup = assistant.get_player_expert_data
+    
+    @lru_cache(maxsize=None)
+    def cached_lookup(name, position, team):
+        return lookup({"name": name, "position": position, "team": team})
+    
+    assistant.get_player_expert_data = lambda player: cached_lookup(player['name'], player['position'], player['team'])
+    return assistant
+
 def export_complete_rankings_to_excel():
     """Export comprehensive rankings with ALL players"""
     print("🏈 EXPORTING COMPLETE 2025 FANTASY FOOTBALL RANKINGS")
@@ -96,17 +116,26 @@ def export_complete_rankings_to_excel():
         return
     
     # Initialize assistant for rankings
-    assistant = CompleteDraftAssistant("dummy_id")
+    assistant = memoize_expert_data(CompleteDraftAssistant("dummy_id"))
     
-    # Process all players
-    rankings_data = []
+    # Process all players into one list per column (filled by index) rather
+    # than a dict per player, and build the DataFrame from those columns
+    n = len(all_fantasy_players)
+    consensus_ranks = [None] * n
+    best_case_ranks = [None] * n
+    worst_case_ranks = [None] * n
+    std_devs = [None] * n
+    ranges = [None] * n
+    has_rankings = [False] * n
+    vorp_scores = [None] * n
+    ranked_players = []  # (row index, player_obj) for players with expert data
     dummy_available = []
     
-    print(f"🧮 Processing rankings for {len(all_fantasy_players)} players...")
+    print(f"🧮 Processing rankings for {n} players...")
     
     for i, player in enumerate(all_fantasy_players):
         if i % 500 == 0:
-            print(f"  Processed {i}/{len(all_fantasy_players)} players...")
+            print(f"  Processed {i}/{n} players...")
         
         # Create player object for ranking lookup
         player_obj = {
@@ -119,54 +148,51 @@ def export_complete_rankings_to_excel():
         # Get expert ranking data
         consensus, high, low, std = assistant.get_player_expert_data(player_obj)
         
-        # Determine if player has ranking
-        if consensus < 999:  # Has ranking data
+        # Only players with ranking data get expert columns filled in
+        if consensus < 999:
             dummy_available.append(player_obj)
-            has_ranking = True
-        else:
-            has_ranking = False
-            consensus = high = low = std = None
-        
-        # Add to rankings data
-        rankings_data.append({
-            'Player_Name': player['name'],
-            'Position': player['position'],
-            'Team': player['team'],
-            'Status': player['status'],
-            'Age': player['age'],
-            'Years_Exp': player['years_exp'],
-            'Injury_Status': player['injury_status'],
-            'Consensus_Rank': consensus,
-            'Best_Case_Rank': high,
-            'Worst_Case_Rank': low,
-            'Expert_Std_Dev': std,
-            'Range': (low - high) if (high is not None and low is not None) else None,
-            'Has_Expert_Ranking': has_ranking,
-            'player_obj': player_obj if has_ranking else None,
-            'Sleeper_ID': player['player_id']
-        })
+            ranked_players.append((i, player_obj))
+            consensus_ranks[i] = consensus
+            best_case_ranks[i] = high
+            worst_case_ranks[i] = low
+            std_devs[i] = std
+            ranges[i] = low - high
+            has_rankings[i] = True
     
-    print(f"✅ Processed all {len(rankings_data)} players")
+    print(f"✅ Processed all {n} players")
     
-    # Calculate VORP for ranked players
+    # Calculate VORP for ranked players. The scarcity part of VORP only looks at
+    # available players at the same position, so hand each call just those
+    # instead of having it filter the full ranked list every time
     print("🧮 Calculating VORP scores...")
-    vorp_count = 0
-    for player_data in rankings_data:
-        if player_data['Has_Expert_Ranking'] and player_data['player_obj']:
-            vorp = assistant.calculate_value_over_replacement(player_data['player_obj'], dummy_available)
-            player_data['VORP_Score'] = round(vorp, 1)
-            vorp_count += 1
-        else:
-            player_data['VORP_Score'] = None
-        
-        # Remove player_obj for Excel export
-        if 'player_obj' in player_data:
-            del player_data['player_obj']
+    available_by_position = defaultdict(list)
+    for player_obj in dummy_available:
+        available_by_position[player_obj['position']].append(player_obj)
+    
+    for i, player_obj in ranked_players:
+        vorp = assistant.calculate_value_over_replacement(player_obj, available_by_position[player_obj['position']])
+        vorp_scores[i] = round(vorp, 1)
     
-    print(f"✅ Calculated VORP for {vorp_count} ranked players")
+    print(f"✅ Calculated VORP for {len(ranked_players)} ranked players")
     
     # Create DataFrame
-    df = pd.DataFrame(rankings_data)
+    df = pd.DataFrame({
+        'Player_Name': [player['name'] for player in all_fantasy_players],
+        'Position': [player['position'] for player in all_fantasy_players],
+        'Team': [player['team'] for player in all_fantasy_players],
+        'Status': [player['status'] for player in all_fantasy_players],
+        'Age': [player['age'] for player in all_fantasy_players],
+        'Years_Exp': [player['years_exp'] for player in all_fantasy_players],
+        'Injury_Status': [player['injury_status'] for player in all_fantasy_players],
+        'Consensus_Rank': consensus_ranks,
+        'Best_Case_Rank': best_case_ranks,
+        'Worst_Case_Rank': worst_case_ranks,
+        'Expert_Std_Dev': std_devs,
+        'Range': ranges,
+        'Has_Expert_Ranking': has_rankings,
+        'Sleeper_ID': [player['player_id'] for player in all_fantasy_players],
+        'VORP_Score': vorp_scores,
+    })
     
     # Sort by consensus rank (NaN values go to end)
     df = df.sort_values(['Consensus_Rank', 'Position', 'Player_Name'], na_position='last')
@@ -184,20 +210,23 @@ def export_complete_rankings_to_excel():
     filename = '/Users/jeffgreenfield/dev/ff_draft_vibe/FF_2025_Complete_Rankings.xlsx'
     print(f"📊 Creating Excel file: {filename}")
     
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+    # Split the frame once; the sheets and summary below only read these slices
+    ranked_mask = df['Has_Expert_Ranking']
+    position_frames = dict(tuple(df.groupby('Position', sort=False)))
+    
+    with pd.ExcelWriter(filename, engine=EXCEL_ENGINE) as writer:
         
         # Overall rankings sheet (only ranked players)
-        overall_df = df[df['Has_Expert_Ranking'] == True].copy()
-        overall_df = overall_df[['Consensus_Rank', 'Player_Name', 'Position', 'Team', 'Position_Rank', 
-                                'Best_Case_Rank', 'Worst_Case_Rank', 'Range', 'Expert_Std_Dev', 'VORP_Score',
-                                'Age', 'Years_Exp', 'Status', 'Injury_Status']]
+        overall_df = df.loc[ranked_mask, ['Consensus_Rank', 'Player_Name', 'Position', 'Team', 'Position_Rank', 
+                                          'Best_Case_Rank', 'Worst_Case_Rank', 'Range', 'Expert_Std_Dev', 'VORP_Score',
+                                          'Age', 'Years_Exp', 'Status', 'Injury_Status']]
         overall_df.to_excel(writer, sheet_name='Overall_Rankings', index=False)
         print(f"  ✅ Overall_Rankings: {len(overall_df)} ranked players")
         
         # Position-specific sheets
         for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST']:
-            pos_df = df[df['Position'] == pos].copy()
-            if not pos_df.empty:
+            pos_df = position_frames.get(pos)
+            if pos_df is not None:
                 pos_df = pos_df[['Position_Rank', 'Player_Name', 'Team', 'Consensus_Rank', 
                                'Best_Case_Rank', 'Worst_Case_Rank', 'Range', 'Expert_Std_Dev', 
                                'VORP_Score', 'Age', 'Years_Exp', 'Status', 'Injury_Status', 'Has_Expert_Ranking']]
@@ -216,8 +245,8 @@ def export_complete_rankings_to_excel():
         # Summary statistics
         summary_data = []
         for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST']:
-            pos_players = df[df['Position'] == pos]
-            ranked_players = pos_players[pos_players['Has_Expert_Ranking'] == True]
+            pos_players = position_frames.get(pos, df.iloc[0:0])
+            ranked_players = pos_players[pos_players['Has_Expert_Ranking']]
             
             summary_data.append({
                 'Position': pos,
@@ -238,8 +267,9 @@ def export_complete_rankings_to_excel():
     print(f"\n🎉 COMPLETE EXCEL FILE CREATED!")
     print(f"📁 File: FF_2025_Complete_Rankings.xlsx")
     print(f"📊 Total players: {len(df)}")
-    print(f"🏆 Players with expert rankings: {len(df[df['Has_Expert_Ranking'] == True])}")
-    print(f"👥 Unranked players: {len(df[df['Has_Expert_Ranking'] == False])}")
+    ranked_count = int(ranked_mask.sum())
+    print(f"🏆 Players with expert rankings: {ranked_count}")
+    print(f"👥 Unranked players: {len(df) - ranked_count}")
     
     # Show position summary
     print(f"\n📈 POSITION BREAKDOWN:")
@@ -20,41 +20,55 @@ def export_all_data():
     print("📤 EXPORTING DATABASE TO CSV FILES")
     print("=" * 40)
     
-    # Export players
-    players_df = pd.read_sql("""
-        SELECT name, position, team, year, is_active, created_at
-        FROM players 
-        ORDER BY position, name;
-    """, conn)
+    cur = conn.cursor()
+    
+    # The two full-table exports are streamed by Postgres straight into the
+    # CSV files with COPY, without building DataFrames
     
-    players_df.to_csv('players_export.csv', index=False)
-    print(f"✅ Exported {len(players_df)} players to players_export.csv")
+    # Export players
+    with open('players_export.csv', 'w', newline='') as f:
+        cur.copy_expert("""
+            COPY (
+                SELECT name, position, team, year, is_active, created_at
+                FROM players 
+                ORDER BY position, name
+            ) TO STDOUT WITH CSV HEADER
+        """, f)
+    print(f"✅ Exported {cur.rowcount} players to players_export.csv")
     
     # Export rankings with player info
-    rankings_df = pd.read_sql("""
-        SELECT p.name, p.position, p.team, rs.source_name, 
-               pr.position_rank, pr.ranking_date
-        FROM players p
-        JOIN player_rankings pr ON p.player_id = pr.player_id
-        JOIN ranking_sources rs ON pr.source_id = rs.source_id
-        ORDER BY rs.source_name, p.position, pr.position_rank;
-    """, conn)
+    with open('rankings_export.csv', 'w', newline='') as f:
+        cur.copy_expert("""
+            COPY (
+                SELECT p.name, p.position, p.team, rs.source_name, 
+                       pr.position_rank, pr.ranking_date
+                FROM players p
+                JOIN player_rankings pr ON p.player_id = pr.player_id
+                JOIN ranking_sources rs ON pr.source_id = rs.source_id
+                ORDER BY rs.source_name, p.position, pr.position_rank
+            ) TO STDOUT WITH CSV HEADER
+        """, f)
+    print(f"✅ Exported {cur.rowcount} rankings to rankings_export.csv")
     
-    rankings_df.to_csv('rankings_export.csv', index=False)
-    print(f"✅ Exported {len(rankings_df)} rankings to rankings_export.csv")
+    cur.close()
     
     # Export by position for easier viewing
     positions = ['QB', 'RB', 'WR', 'TE']
     
+    # One query for all positions, split into per-position files client-side
+    all_pos_df = pd.read_sql("""
+        SELECT p.position, p.name, p.team, rs.source_name, pr.position_rank
+        FROM players p
+        JOIN player_rankings pr ON p.player_id = pr.player_id
+        JOIN ranking_sources rs ON pr.source_id = rs.source_id
+        WHERE p.position = ANY(%s)
+        ORDER BY p.position, rs.source_name, pr.position_rank;
+    """, conn, params=(positions,))
+    by_position = dict(tuple(all_pos_df.groupby('position', sort=False)))
+    
     for pos in positions:
-        pos_df = pd.read_sql(f"""
-            SELECT p.name, p.team, rs.source_name, pr.position_rank
-            FROM players p
-            JOIN player_rankings pr ON p.player_id = pr.player_id
-            JOIN ranking_sources rs ON pr.source_id = rs.source_id
-            WHERE p.position = '{pos}'
-            ORDER BY rs.source_name, pr.position_rank;
-        """, conn)
+        # A position with no rankings still gets a header-only file
+        pos_df = by_position.get(pos, all_pos_df.iloc[0:0]).drop(columns='position')
         
         filename = f'{pos.lower()}_rankings.csv'
         pos_df.to_csv(filename, index=False)
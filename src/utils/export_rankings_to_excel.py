@@ -8,133 +8,122 @@ sys.path.append('/Users/jeffgreenfield/dev/ff_draft_vibe')
 import pandas as pd
 from complete_sleeper_assistant import CompleteDraftAssistant
 
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:  # xlsxwriter is optional; fall back to openpyxl
+    EXCEL_ENGINE = 'openpyxl'
+
+# Comprehensive player database with positions and teams
+ALL_PLAYERS = (
+    # Elite WRs
+    ("Ja'Marr Chase", "WR", "CIN"), ("Justin Jefferson", "WR", "MIN"), ("CeeDee Lamb", "WR", "DAL"),
+    ("Amon-Ra St. Brown", "WR", "DET"), ("Puka Nacua", "WR", "LAR"), ("Malik Nabers", "WR", "NYG"),
+    ("Brian Thomas Jr.", "WR", "JAX"), ("Nico Collins", "WR", "HOU"), ("Drake London", "WR", "ATL"),
+    ("A.J. Brown", "WR", "PHI"), ("Ladd McConkey", "WR", "LAC"), ("Jaxon Smith-Njigba", "WR", "SEA"),
+    ("Tee Higgins", "WR", "CIN"), ("D.K. Metcalf", "WR", "SEA"), ("Rome Odunze", "WR", "CHI"),
+    ("Marvin Harrison Jr.", "WR", "ARI"), ("Stefon Diggs", "WR", "HOU"), ("Mike Evans", "WR", "TB"),
+    ("Chris Godwin", "WR", "TB"), ("Calvin Ridley", "WR", "TEN"), ("Jaylen Waddle", "WR", "MIA"),
+    ("Cooper Kupp", "WR", "LAR"), ("Davante Adams", "WR", "LV"), ("Keon Coleman", "WR", "BUF"),
+    ("Jayden Reed", "WR", "GB"), ("DJ Moore", "WR", "CHI"), ("Courtland Sutton", "WR", "DEN"),
+    ("Jerry Jeudy", "WR", "CLE"), ("Amari Cooper", "WR", "BUF"), ("Tyler Lockett", "WR", "SEA"),
+    ("DeAndre Hopkins", "WR", "KC"), ("Keenan Allen", "WR", "CHI"), ("Brandon Aiyuk", "WR", "SF"),
+    ("Diontae Johnson", "WR", "CAR"), ("Terry McLaurin", "WR", "WAS"), ("Michael Pittman Jr.", "WR", "IND"),
+    ("Tank Dell", "WR", "HOU"), ("Jordan Addison", "WR", "MIN"), ("Jameson Williams", "WR", "DET"),
+    ("Josh Downs", "WR", "IND"), ("Wan'Dale Robinson", "WR", "NYG"), ("Darnell Mooney", "WR", "ATL"),
+    ("Xavier Legette", "WR", "CAR"), ("Cedrick Wilson Jr.", "WR", "NO"), ("Tutu Atwell", "WR", "LAR"),
+    ("Demario Douglas", "WR", "NE"), ("Jalen McMillan", "WR", "TB"), ("Malachi Corley", "WR", "NYJ"),
+    ("Troy Franklin", "WR", "DEN"), ("Ja'Lynn Polk", "WR", "NE"), ("Ricky Pearsall", "WR", "SF"),
+    ("Javon Baker", "WR", "NE"), ("Luke McCaffrey", "WR", "WAS"), ("Adonai Mitchell", "WR", "IND"),
+    
+    # Elite RBs
+    ("Bijan Robinson", "RB", "ATL"), ("Saquon Barkley", "RB", "PHI"), ("Jahmyr Gibbs", "RB", "DET"),
+    ("De'Von Achane", "RB", "MIA"), ("Ashton Jeanty", "RB", "LV"), ("Christian McCaffrey", "RB", "SF"),
+    ("Josh Jacobs", "RB", "GB"), ("Derrick Henry", "RB", "BAL"), ("Breece Hall", "RB", "NYJ"),
+    ("Chase Brown", "RB", "CIN"), ("Kenneth Walker III", "RB", "SEA"), ("James Cook", "RB", "BUF"),
+    ("Devon Singletary", "RB", "NYG"), ("Jordan Mason", "RB", "SF"), ("Rachaad White", "RB", "TB"),
+    ("Javonte Williams", "RB", "DEN"), ("D'Andre Swift", "RB", "CHI"), ("Najee Harris", "RB", "PIT"),
+    ("Aaron Jones", "RB", "MIN"), ("Alvin Kamara", "RB", "NO"), ("Austin Ekeler", "RB", "WAS"),
+    ("Tony Pollard", "RB", "TEN"), ("Zack Moss", "RB", "CIN"), ("Bucky Irving", "RB", "TB"),
+    ("Ty Chandler", "RB", "MIN"), ("Blake Corum", "RB", "LAR"), ("Braelon Allen", "RB", "NYJ"),
+    ("Kimani Vidal", "RB", "LAC"), ("Ray Davis", "RB", "BUF"), ("Tyjae Spears", "RB", "TEN"),
+    ("Jaylen Warren", "RB", "PIT"), ("Jerome Ford", "RB", "CLE"), ("Alexander Mattison", "RB", "LV"),
+    ("Devin Singletary", "RB", "NYG"), ("Rico Dowdle", "RB", "DAL"), ("Quinshon Judkins", "RB", "DET"),
+    ("Trey Benson", "RB", "ARI"), ("Jaylen Wright", "RB", "MIA"), ("Isaac Guerendo", "RB", "SF"),
+    ("Cam Akers", "RB", "HOU"), ("Justice Hill", "RB", "BAL"), ("Samaje Perine", "RB", "KC"),
+    ("Tyler Allgeier", "RB", "ATL"), ("A.J. Dillon", "RB", "GB"), ("Roschon Johnson", "RB", "CHI"),
+    
+    # TEs
+    ("Brock Bowers", "TE", "LV"), ("Trey McBride", "TE", "ARI"), ("George Kittle", "TE", "SF"),
+    ("Sam LaPorta", "TE", "DET"), ("T.J. Hockenson", "TE", "MIN"), ("Travis Kelce", "TE", "KC"),
+    ("Evan Engram", "TE", "JAX"), ("Tucker Kraft", "TE", "GB"), ("David Njoku", "TE", "CLE"),
+    ("Kyle Pitts", "TE", "ATL"), ("Jake Ferguson", "TE", "DAL"), ("Jonnu Smith", "TE", "MIA"),
+    ("Tyler Higbee", "TE", "LAR"), ("Hunter Henry", "TE", "NE"), ("Noah Fant", "TE", "SEA"),
+    ("Pat Freiermuth", "TE", "PIT"), ("Cole Kmet", "TE", "CHI"), ("Dalton Kincaid", "TE", "BUF"),
+    ("Mark Andrews", "TE", "BAL"), ("Dalton Schultz", "TE", "HOU"), ("Mike Gesicki", "TE", "CIN"),
+    
+    # QBs
+    ("Josh Allen", "QB", "BUF"), ("Lamar Jackson", "QB", "BAL"), ("Jayden Daniels", "QB", "WAS"),
+    ("Jalen Hurts", "QB", "PHI"), ("Bo Nix", "QB", "DEN"), ("Joe Burrow", "QB", "CIN"),
+    ("Baker Mayfield", "QB", "TB"), ("Patrick Mahomes", "QB", "KC"), ("Caleb Williams", "QB", "CHI"),
+    ("Justin Herbert", "QB", "LAC"), ("Dak Prescott", "QB", "DAL"), ("Tua Tagovailoa", "QB", "MIA"),
+    ("Anthony Richardson", "QB", "IND"), ("Kirk Cousins", "QB", "ATL"), ("Aaron Rodgers", "QB", "NYJ"),
+    ("Russell Wilson", "QB", "PIT"), ("Kyler Murray", "QB", "ARI"), ("Geno Smith", "QB", "SEA"),
+    ("Daniel Jones", "QB", "NYG"), ("Drake Maye", "QB", "NE"), ("Michael Penix Jr.", "QB", "ATL"),
+    ("J.J. McCarthy", "QB", "MIN"), ("Malik Willis", "QB", "GB"), ("Sam Darnold", "QB", "MIN"),
+    ("Gardner Minshew", "QB", "LV"), ("Justin Fields", "QB", "PIT"), ("Jacoby Brissett", "QB", "NE"),
+    
+    # Add some Kickers and Defenses for completeness
+    ("Justin Tucker", "K", "BAL"), ("Harrison Butker", "K", "KC"), ("Tyler Bass", "K", "BUF"),
+    ("Brandon McManus", "K", "GB"), ("Younghoe Koo", "K", "ATL"), ("Chris Boswell", "K", "PIT"),
+    ("49ers", "D/ST", "SF"), ("Ravens", "D/ST", "BAL"), ("Bills", "D/ST", "BUF"),
+    ("Eagles", "D/ST", "PHI"), ("Cowboys", "D/ST", "DAL"), ("Steelers", "D/ST", "PIT"),
+)
+
 def export_all_rankings_to_excel():
     assistant = CompleteDraftAssistant("dummy_id")
     
     print("🏈 EXPORTING ALL 2025 FANTASY FOOTBALL RANKINGS TO EXCEL")
     print("=" * 60)
     
-    # Comprehensive player database with positions and teams
-    all_players = [
-        # Elite WRs
-        ("Ja'Marr Chase", "WR", "CIN"), ("Justin Jefferson", "WR", "MIN"), ("CeeDee Lamb", "WR", "DAL"),
-        ("Amon-Ra St. Brown", "WR", "DET"), ("Puka Nacua", "WR", "LAR"), ("Malik Nabers", "WR", "NYG"),
-        ("Brian Thomas Jr.", "WR", "JAX"), ("Nico Collins", "WR", "HOU"), ("Drake London", "WR", "ATL"),
-        ("A.J. Brown", "WR", "PHI"), ("Ladd McConkey", "WR", "LAC"), ("Jaxon Smith-Njigba", "WR", "SEA"),
-        ("Tee Higgins", "WR", "CIN"), ("D.K. Metcalf", "WR", "SEA"), ("Rome Odunze", "WR", "CHI"),
-        ("Marvin Harrison Jr.", "WR", "ARI"), ("Stefon Diggs", "WR", "HOU"), ("Mike Evans", "WR", "TB"),
-        ("Chris Godwin", "WR", "TB"), ("Calvin Ridley", "WR", "TEN"), ("Jaylen Waddle", "WR", "MIA"),
-        ("Cooper Kupp", "WR", "LAR"), ("Davante Adams", "WR", "LV"), ("Keon Coleman", "WR", "BUF"),
-        ("Jayden Reed", "WR", "GB"), ("DJ Moore", "WR", "CHI"), ("Courtland Sutton", "WR", "DEN"),
-        ("Jerry Jeudy", "WR", "CLE"), ("Amari Cooper", "WR", "BUF"), ("Tyler Lockett", "WR", "SEA"),
-        ("DeAndre Hopkins", "WR", "KC"), ("Keenan Allen", "WR", "CHI"), ("Brandon Aiyuk", "WR", "SF"),
-        ("Diontae Johnson", "WR", "CAR"), ("Terry McLaurin", "WR", "WAS"), ("Michael Pittman Jr.", "WR", "IND"),
-        ("Tank Dell", "WR", "HOU"), ("Jordan Addison", "WR", "MIN"), ("Jameson Williams", "WR", "DET"),
-        ("Josh Downs", "WR", "IND"), ("Wan'Dale Robinson", "WR", "NYG"), ("Darnell Mooney", "WR", "ATL"),
-        ("Xavier Legette", "WR", "CAR"), ("Cedrick Wilson Jr.", "WR", "NO"), ("Tutu Atwell", "WR", "LAR"),
-        ("Demario Douglas", "WR", "NE"), ("Jalen McMillan", "WR", "TB"), ("Malachi Corley", "WR", "NYJ"),
-        ("Troy Franklin", "WR", "DEN"), ("Ja'Lynn Polk", "WR", "NE"), ("Ricky Pearsall", "WR", "SF"),
-        ("Javon Baker", "WR", "NE"), ("Luke McCaffrey", "WR", "WAS"), ("Adonai Mitchell", "WR", "IND"),
-        
-        # Elite RBs
-        ("Bijan Robinson", "RB", "ATL"), ("Saquon Barkley", "RB", "PHI"), ("Jahmyr Gibbs", "RB", "DET"),
-        ("De'Von Achane", "RB", "MIA"), ("Ashton Jeanty", "RB", "LV"), ("Christian McCaffrey", "RB", "SF"),
-        ("Josh Jacobs", "RB", "GB"), ("Derrick Henry", "RB", "BAL"), ("Breece Hall", "RB", "NYJ"),
-        ("Chase Brown", "RB", "CIN"), ("Kenneth Walker III", "RB", "SEA"), ("James Cook", "RB", "BUF"),
-        ("Devon Singletary", "RB", "NYG"), ("Jordan Mason", "RB", "SF"), ("Rachaad White", "RB", "TB"),
-        ("Javonte Williams", "RB", "DEN"), ("D'Andre Swift", "RB", "CHI"), ("Najee Harris", "RB", "PIT"),
-        ("Aaron Jones", "RB", "MIN"), ("Alvin Kamara", "RB", "NO"), ("Austin Ekeler", "RB", "WAS"),
-        ("Tony Pollard", "RB", "TEN"), ("Zack Moss", "RB", "CIN"), ("Bucky Irving", "RB", "TB"),
-        ("Ty Chandler", "RB", "MIN"), ("Blake Corum", "RB", "LAR"), ("Braelon Allen", "RB", "NYJ"),
-        ("Kimani Vidal", "RB", "LAC"), ("Ray Davis", "RB", "BUF"), ("Tyjae Spears", "RB", "TEN"),
-        ("Jaylen Warren", "RB", "PIT"), ("Jerome Ford", "RB", "CLE"), ("Alexander Mattison", "RB", "LV"),
-        ("Devin Singletary", "RB", "NYG"), ("Rico Dowdle", "RB", "DAL"), ("Quinshon Judkins", "RB", "DET"),
-        ("Trey Benson", "RB", "ARI"), ("Jaylen Wright", "RB", "MIA"), ("Isaac Guerendo", "RB", "SF"),
-        ("Cam Akers", "RB", "HOU"), ("Justice Hill", "RB", "BAL"), ("Samaje Perine", "RB", "KC"),
-        ("Tyler Allgeier", "RB", "ATL"), ("A.J. Dillon", "RB", "GB"), ("Roschon Johnson", "RB", "CHI"),
-        
-        # TEs
-        ("Brock Bowers", "TE", "LV"), ("Trey McBride", "TE", "ARI"), ("George Kittle", "TE", "SF"),
-        ("Sam LaPorta", "TE", "DET"), ("T.J. Hockenson", "TE", "MIN"), ("Travis Kelce", "TE", "KC"),
-        ("Evan Engram", "TE", "JAX"), ("Tucker Kraft", "TE", "GB"), ("David Njoku", "TE", "CLE"),
-        ("Kyle Pitts", "TE", "ATL"), ("Jake Ferguson", "TE", "DAL"), ("Jonnu Smith", "TE", "MIA"),
-        ("Tyler Higbee", "TE", "LAR"), ("Hunter Henry", "TE", "NE"), ("Noah Fant", "TE", "SEA"),
-        ("Pat Freiermuth", "TE", "PIT"), ("Cole Kmet", "TE", "CHI"), ("Dalton Kincaid", "TE", "BUF"),
-        ("Mark Andrews", "TE", "BAL"), ("Dalton Schultz", "TE", "HOU"), ("Mike Gesicki", "TE", "CIN"),
-        
-        # QBs
-        ("Josh Allen", "QB", "BUF"), ("Lamar Jackson", "QB", "BAL"), ("Jayden Daniels", "QB", "WAS"),
-        ("Jalen Hurts", "QB", "PHI"), ("Bo Nix", "QB", "DEN"), ("Joe Burrow", "QB", "CIN"),
-        ("Baker Mayfield", "QB", "TB"), ("Patrick Mahomes", "QB", "KC"), ("Caleb Williams", "QB", "CHI"),
-        ("Justin Herbert", "QB", "LAC"), ("Dak Prescott", "QB", "DAL"), ("Tua Tagovailoa", "QB", "MIA"),
-        ("Anthony Richardson", "QB", "IND"), ("Kirk Cousins", "QB", "ATL"), ("Aaron Rodgers", "QB", "NYJ"),
-        ("Russell Wilson", "QB", "PIT"), ("Kyler Murray", "QB", "ARI"), ("Geno Smith", "QB", "SEA"),
-        ("Daniel Jones", "QB", "NYG"), ("Drake Maye", "QB", "NE"), ("Michael Penix Jr.", "QB", "ATL"),
-        ("J.J. McCarthy", "QB", "MIN"), ("Malik Willis", "QB", "GB"), ("Sam Darnold", "QB", "MIN"),
-        ("Gardner Minshew", "QB", "LV"), ("Justin Fields", "QB", "PIT"), ("Jacoby Brissett", "QB", "NE"),
-        
-        # Add some Kickers and Defenses for completeness
-        ("Justin Tucker", "K", "BAL"), ("Harrison Butker", "K", "KC"), ("Tyler Bass", "K", "BUF"),
-        ("Brandon McManus", "K", "GB"), ("Younghoe Koo", "K", "ATL"), ("Chris Boswell", "K", "PIT"),
-        ("49ers", "D/ST", "SF"), ("Ravens", "D/ST", "BAL"), ("Bills", "D/ST", "BUF"),
-        ("Eagles", "D/ST", "PHI"), ("Cowboys", "D/ST", "DAL"), ("Steelers", "D/ST", "PIT"),
-    ]
+    print(f"📊 Processing {len(ALL_PLAYERS)} players...")
     
-    # Process all players
-    rankings_data = []
-    dummy_available = []
+    # Look up expert data for every player with one merge instead of a call per player
+    players_df = pd.DataFrame(ALL_PLAYERS, columns=['Player_Name', 'Position', 'Team'])
+    expert = assistant.get_expert_data_batch(players_df)
     
-    print(f"📊 Processing {len(all_players)} players...")
+    # Include all players, even those without rankings
+    has_ranking = expert['consensus'] < 999
+    expert = expert[has_ranking].reindex(expert.index)
+    rankings_df = players_df.assign(
+        Consensus_Rank=expert['consensus'].astype('float32'),
+        Best_Case_Rank=expert['high'],
+        Worst_Case_Rank=expert['low'],
+        Expert_Std_Dev=expert['std'],
+        Range=expert['low'] - expert['high'],
+        Has_Expert_Ranking=has_ranking,
+    )
+    # Position and Team only take a few dozen values; categories make the
+    # per-position groupby and sheet filters compare small integer codes
+    rankings_df = rankings_df.astype({'Position': 'category', 'Team': 'category'})
     
-    for name, pos, team in all_players:
-        player_obj = {"name": name, "position": pos, "team": team, "player_id": f"export_{name.replace(' ', '_')}"}
-        consensus, high, low, std = assistant.get_player_expert_data(player_obj)
-        
-        # Include all players, even those without rankings
-        if consensus < 999:  # Has ranking data
-            dummy_available.append(player_obj)
-            has_ranking = True
-        else:
-            has_ranking = False
-            consensus = high = low = std = None
-        
-        rankings_data.append({
-            'Player_Name': name,
-            'Position': pos,
-            'Team': team,
-            'Consensus_Rank': consensus,
-            'Best_Case_Rank': high,
-            'Worst_Case_Rank': low,
-            'Expert_Std_Dev': std,
-            'Range': (low - high) if (high is not None and low is not None) else None,
-            'Has_Expert_Ranking': has_ranking,
-            'player_obj': player_obj if has_ranking else None
-        })
-    
-    # Calculate VORP for ranked players
+    # Calculate VORP for ranked players, with every ranked player as the available pool
     print("🧮 Calculating VORP scores...")
-    for i, player_data in enumerate(rankings_data):
-        if player_data['Has_Expert_Ranking'] and player_data['player_obj']:
-            vorp = assistant.calculate_value_over_replacement(player_data['player_obj'], dummy_available)
-            player_data['VORP_Score'] = round(vorp, 1)
-        else:
-            player_data['VORP_Score'] = None
-        
-        # Remove player_obj for Excel export
-        del player_data['player_obj']
-    
-    # Create DataFrame
-    df = pd.DataFrame(rankings_data)
+    ranked = players_df[has_ranking].join(expert[has_ranking])
+    # Python's round, not Series.round, so halves round as the per-player export did
+    rankings_df['VORP_Score'] = assistant.calculate_vorp_batch(ranked).map(lambda v: round(v, 1))
     
     # Sort by consensus rank (NaN values go to end)
-    df = df.sort_values(['Consensus_Rank', 'Player_Name'], na_position='last')
+    df = rankings_df.sort_values(['Consensus_Rank', 'Player_Name'], na_position='last')
     
     # Add positional rankings
     print("🏆 Adding positional rankings...")
-    df['Position_Rank'] = df.groupby('Position')['Consensus_Rank'].rank(method='min', na_option='bottom').astype('Int64')
+    # na_option='bottom' gives every player a finite rank, so a plain integer column works
+    df['Position_Rank'] = df.groupby('Position', observed=True)['Consensus_Rank'].rank(method='min', na_option='bottom').astype('int32')
     
-    # Create separate sheets for each position
-    with pd.ExcelWriter('/Users/jeffgreenfield/dev/ff_draft_vibe/FF_2025_Rankings.xlsx', engine='openpyxl') as writer:
+    # Create separate sheets for each position; xlsxwriter streams each row out
+    # as XML instead of building an openpyxl cell tree for the whole workbook
+    with pd.ExcelWriter('/Users/jeffgreenfield/dev/ff_draft_vibe/FF_2025_Rankings.xlsx', engine=EXCEL_ENGINE) as writer:
         
         # Overall rankings sheet
         overall_df = df[df['Has_Expert_Ranking'] == True].copy()
@@ -18,11 +18,10 @@ def get_db_connection():
         database='fantasy_draft_db'
     )
 
-def remove_consensus_adp():
+def remove_consensus_adp(conn):
     """Remove the Consensus ADP source that's polluting data"""
     print("🧹 Removing Consensus ADP source...")
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -54,13 +53,11 @@ def remove_consensus_adp():
         raise
     finally:
         cur.close()
-        conn.close()
 
-def remove_rotowire_position_rankings():
+def remove_rotowire_position_rankings(conn):
     """Remove corrupted Rotowire position rankings"""
     print("🧹 Removing corrupted Rotowire position rankings...")
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -92,13 +89,11 @@ def remove_rotowire_position_rankings():
         raise
     finally:
         cur.close()
-        conn.close()
 
-def verify_cleanup():
+def verify_cleanup(conn):
     """Verify the cleanup worked"""
     print("🔍 Verifying cleanup...")
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -132,16 +127,20 @@ def verify_cleanup():
         
     finally:
         cur.close()
-        conn.close()
 
 if __name__ == "__main__":
     print("🚀 Fixing ADP and Rotowire issues...\n")
     
-    remove_consensus_adp()
-    print()
-    remove_rotowire_position_rankings()
-    print()
-    verify_cleanup()
+    # One connection for every step; each step still commits its own work
+    conn = get_db_connection()
+    try:
+        remove_consensus_adp(conn)
+        print()
+        remove_rotowire_position_rankings(conn)
+        print()
+        verify_cleanup(conn)
+    finally:
+        conn.close()
     
     print("\n✅ Cleanup complete!")
     print("\nNext steps:")
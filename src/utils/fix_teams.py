@@ -3,6 +3,7 @@
 Fix team assignments automatically
 """
 import psycopg2
+from psycopg2.extras import execute_values
 import os
 
 def fix_team_assignments():
@@ -28,26 +29,24 @@ def fix_team_assignments():
     print("🔧 FIXING TEAM ASSIGNMENTS")
     print("=" * 30)
     
-    for player_name, correct_team in fixes:
-        # Find player
-        cur.execute("""
-            SELECT player_id, name, team FROM players 
-            WHERE name ILIKE %s;
-        """, (f"%{player_name}%",))
-        
-        result = cur.fetchone()
-        if result:
-            player_id, name, old_team = result
-            
-            # Update team
-            cur.execute("""
-                UPDATE players 
-                SET team = %s, updated_at = CURRENT_TIMESTAMP
-                WHERE player_id = %s;
-            """, (correct_team, player_id))
-            
-            print(f"✅ Fixed {name}: {old_team} → {correct_team}")
-        else:
+    # Apply every fix in one UPDATE; the second players alias exposes each
+    # row's team from before the update for the report
+    updated = execute_values(cur, """
+        UPDATE players 
+        SET team = data.team, updated_at = CURRENT_TIMESTAMP
+        FROM (VALUES %s) AS data(pattern, team), players old
+        WHERE players.name ILIKE data.pattern
+        AND old.player_id = players.player_id
+        RETURNING data.pattern, players.name, old.team, data.team;
+    """, [(f"%{player_name}%", correct_team) for player_name, correct_team in fixes], fetch=True)
+    
+    matched = set()
+    for pattern, name, old_team, correct_team in updated:
+        matched.add(pattern)
+        print(f"✅ Fixed {name}: {old_team} → {correct_team}")
+    
+    for player_name, _ in fixes:
+        if f"%{player_name}%" not in matched:
             print(f"⚠️ Player '{player_name}' not found")
     
     conn.commit()
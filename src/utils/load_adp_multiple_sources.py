@@ -30,9 +30,10 @@ def load_adp_multiple_sources():
         print("\nFirst 10 rows:")
         print(df.head(10))
         
-        # Show unique values in each column to understand the structure
+        # Show unique values in each column to understand the structure; the
+        # first 2000 rows are plenty to find 10 samples
         for col in df.columns:
-            unique_vals = df[col].dropna().unique()[:10]  # Show first 10 unique values
+            unique_vals = df[col].iloc[:2000].dropna().drop_duplicates().head(10).tolist()  # Show first 10 unique values
             print(f"\n{col} - Sample values: {unique_vals}")
         
     except Exception as e:
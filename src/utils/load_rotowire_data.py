@@ -3,11 +3,16 @@
 Load Rotowire ADP and position rankings into the database
 """
 
+import csv
+import io
 import pandas as pd
 import psycopg2
 import os
 from datetime import datetime
 
+# Positions a Rotowire sheet or row can hold; DEF is loaded as DST
+VALID_POSITIONS = frozenset(['QB', 'RB', 'WR', 'TE', 'K', 'DST', 'DEF'])
+
 def get_db_connection():
     """Get database connection"""
     return psycopg2.connect(
@@ -18,11 +23,42 @@ def get_db_connection():
         database='fantasy_draft_db'
     )
 
-def load_rotowire_adp():
+def upsert_rankings(cur, rows, rank_columns):
+    """Upsert (player_id, source_id, *rank_columns) rows into player_rankings
+    
+    The rows are streamed into a temporary staging table with COPY and merged
+    with a single INSERT ... SELECT ... ON CONFLICT in player_id order.
+    """
+    columns = ', '.join(['player_id', 'source_id', *rank_columns])
+    updates = ', '.join(f"{col} = EXCLUDED.{col}" for col in rank_columns)
+    
+    cur.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS rankings_staging (
+            player_id INTEGER, source_id INTEGER, overall_rank INTEGER, position_rank INTEGER
+        ) ON COMMIT DROP
+    """)
+    
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+    cur.copy_expert(f"COPY rankings_staging ({columns}) FROM STDIN WITH CSV", buf)
+    
+    # The rankings can be reloaded from the spreadsheets, so this transaction
+    # doesn't need to wait for its WAL flush on commit
+    cur.execute("SET LOCAL synchronous_commit = OFF")
+    
+    cur.execute(f"""
+        INSERT INTO player_rankings ({columns})
+        SELECT {columns} FROM rankings_staging
+        ORDER BY player_id, source_id
+        ON CONFLICT (player_id, source_id, ranking_date) 
+        DO UPDATE SET {updates}
+    """)
+
+def load_rotowire_adp(conn):
     """Load Rotowire ADP overall rankings"""
     print("📊 Loading Rotowire ADP overall rankings...")
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -33,6 +69,15 @@ def load_rotowire_adp():
         print("\nFirst 5 rows:")
         print(df.head())
         
+        # Find the name and ADP columns once, then drop and clean rows column-wise
+        name_col = next((c for c in ('Player Name', 'Player', 'Name', 'PLAYER') if c in df.columns), None)
+        rank_col = next((c for c in ('ADP', 'Rank', 'RANK', 'Overall') if c in df.columns), None)
+        if name_col is None or rank_col is None:
+            print("❌ Could not find player name and ADP columns")
+            return
+        df = df.dropna(subset=[name_col, rank_col])
+        df = df.assign(**{name_col: df[name_col].astype(str).str.strip(), rank_col: df[rank_col].astype(int)})
+        
         # Create source if it doesn't exist
         cur.execute("""
             INSERT INTO ranking_sources (source_name, base_url, has_ppr_rankings, has_position_ranks, quality_score)
@@ -48,47 +93,53 @@ def load_rotowire_adp():
         # Clear existing rankings for this source
         cur.execute("DELETE FROM player_rankings WHERE source_id = %s", (source_id,))
         
-        # Process and insert ADP data
-        inserted = 0
+        # Resolve exact names in-process from one pass over the players table
+        cur.execute("SELECT player_id, LOWER(name), position FROM players")
+        name_map = {name: (player_id, position) for player_id, name, position in cur.fetchall()}
+        
+        # Process ADP data; rankings are keyed by player so a player matched by
+        # two spreadsheet names appears once in the batch (last one wins)
+        rankings = {}
+        misses = []
         not_found = []
         
-        for idx, row in df.iterrows():
-            player_name = row.get('Player Name') or row.get('Player') or row.get('Name') or row.get('PLAYER')
-            adp_rank = row.get('ADP') or row.get('Rank') or row.get('RANK') or row.get('Overall')
-            
-            if pd.isna(player_name) or pd.isna(adp_rank):
-                continue
-            
-            # Clean player name
-            player_name = str(player_name).strip()
-            
-            # Try to find player in database
-            cur.execute("""
-                SELECT player_id, position FROM players 
-                WHERE LOWER(name) = LOWER(%s) 
-                OR LOWER(name) LIKE LOWER(%s)
-                LIMIT 1
-            """, (player_name, f"%{player_name}%"))
-            
-            player_result = cur.fetchone()
+        for player_name, adp_rank in df[[name_col, rank_col]].itertuples(index=False, name=None):
+            player_result = name_map.get(player_name.lower())
             
             if player_result:
                 player_id, position = player_result
                 
-                # Insert ranking - use overall_rank for ADP
-                cur.execute("""
-                    INSERT INTO player_rankings (player_id, source_id, overall_rank, position_rank)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (player_id, source_id, ranking_date) 
-                    DO UPDATE SET overall_rank = EXCLUDED.overall_rank, position_rank = EXCLUDED.position_rank
-                """, (player_id, source_id, int(adp_rank), int(adp_rank)))
-                
-                inserted += 1
+                # Use overall_rank for ADP
+                rankings[player_id] = (player_id, source_id, int(adp_rank), int(adp_rank))
             else:
-                not_found.append((player_name, adp_rank))
+                misses.append((player_name, adp_rank))
+        
+        # Try a partial-name match for the remaining names in one query; an
+        # exact match for the same player takes precedence
+        if misses:
+            cur.execute("""
+                SELECT q.pattern, m.player_id
+                FROM unnest(%s::text[]) AS q(pattern)
+                CROSS JOIN LATERAL (
+                    SELECT player_id FROM players
+                    WHERE LOWER(name) LIKE LOWER(q.pattern)
+                    LIMIT 1
+                ) m
+            """, ([f"%{player_name}%" for player_name, _ in misses],))
+            partial_matches = dict(cur.fetchall())
+            
+            for player_name, adp_rank in misses:
+                player_id = partial_matches.get(f"%{player_name}%")
+                if player_id:
+                    rankings.setdefault(player_id, (player_id, source_id, int(adp_rank), int(adp_rank)))
+                else:
+                    not_found.append((player_name, adp_rank))
+        
+        # Insert all rankings in one batch
+        upsert_rankings(cur, rankings.values(), ['overall_rank', 'position_rank'])
         
         conn.commit()
-        print(f"\n✅ Inserted {inserted} ADP rankings")
+        print(f"\n✅ Inserted {len(rankings)} ADP rankings")
         
         if not_found:
             print(f"\n⚠️ Players not found in database ({len(not_found)}):")
@@ -103,13 +154,11 @@ def load_rotowire_adp():
         raise
     finally:
         cur.close()
-        conn.close()
 
-def load_rotowire_position_rankings():
+def load_rotowire_position_rankings(conn):
     """Load Rotowire position rankings"""
     print("\n📊 Loading Rotowire position rankings...")
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -132,16 +181,21 @@ def load_rotowire_position_rankings():
         # Clear existing rankings for this source
         cur.execute("DELETE FROM player_rankings WHERE source_id = %s", (source_id,))
         
-        total_inserted = 0
+        # Resolve players in-process from one pass over the players table
+        cur.execute("SELECT player_id, LOWER(name), position FROM players")
+        player_map = {(name, position): player_id for player_id, name, position in cur.fetchall()}
+        
+        # Rankings from every sheet, keyed by player so each appears once in the batch
+        rankings = {}
         
         # Process each sheet (assuming each sheet is a position)
         for sheet_name in xl_file.sheet_names:
             print(f"\n📋 Processing sheet: {sheet_name}")
-            df = pd.read_excel('rotowire rankings.xlsx', sheet_name=sheet_name)
+            df = xl_file.parse(sheet_name)
             
             # Try to determine position from sheet name
             position = sheet_name.upper()
-            if position not in ['QB', 'RB', 'WR', 'TE', 'K', 'DST', 'DEF']:
+            if position not in VALID_POSITIONS:
                 print(f"   ⚠️ Skipping sheet {sheet_name} - unknown position")
                 continue
             
@@ -150,44 +204,37 @@ def load_rotowire_position_rankings():
             
             print(f"   Columns: {df.columns.tolist()}")
             
+            # Find the name and rank columns once; without a rank column the
+            # sheet order is the ranking
+            name_col = next((c for c in ('Player', 'Name', 'PLAYER') if c in df.columns), None)
+            rank_col = next((c for c in ('Rank', 'RANK', 'Pos Rank') if c in df.columns), None)
+            if name_col is None:
+                print(f"   ⚠️ Skipping sheet {sheet_name} - no player column")
+                continue
+            if rank_col is None:
+                rank_col = 'Rank'
+                df[rank_col] = range(1, len(df) + 1)
+            
+            df = df.dropna(subset=[name_col])
+            df = df.assign(**{name_col: df[name_col].astype(str).str.strip(), rank_col: df[rank_col].astype(int)})
+            
             inserted = 0
             
-            for idx, row in df.iterrows():
-                player_name = row.get('Player') or row.get('Name') or row.get('PLAYER')
-                rank = row.get('Rank') or row.get('RANK') or row.get('Pos Rank') or (idx + 1)
-                
-                if pd.isna(player_name):
-                    continue
-                
-                player_name = str(player_name).strip()
-                
+            for player_name, rank in df[[name_col, rank_col]].itertuples(index=False, name=None):
                 # Try to find player
-                cur.execute("""
-                    SELECT player_id FROM players 
-                    WHERE LOWER(name) = LOWER(%s) AND position = %s
-                    LIMIT 1
-                """, (player_name, position))
+                player_id = player_map.get((player_name.lower(), position))
                 
-                player_result = cur.fetchone()
-                
-                if player_result:
-                    player_id = player_result[0]
-                    
-                    # Insert position ranking
-                    cur.execute("""
-                        INSERT INTO player_rankings (player_id, source_id, position_rank)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (player_id, source_id, ranking_date) 
-                        DO UPDATE SET position_rank = EXCLUDED.position_rank
-                    """, (player_id, source_id, int(rank)))
-                    
+                if player_id:
+                    rankings[player_id] = (player_id, source_id, int(rank))
                     inserted += 1
             
-            print(f"   ✅ Inserted {inserted} {position} rankings")
-            total_inserted += inserted
+            print(f"   ✅ Matched {inserted} {position} rankings")
+        
+        # Insert the position rankings from all sheets in one batch
+        upsert_rankings(cur, rankings.values(), ['position_rank'])
         
         conn.commit()
-        print(f"\n✅ Total inserted: {total_inserted} position rankings")
+        print(f"\n✅ Total inserted: {len(rankings)} position rankings")
         
     except Exception as e:
         conn.rollback()
@@ -195,13 +242,11 @@ def load_rotowire_position_rankings():
         raise
     finally:
         cur.close()
-        conn.close()
 
-def verify_adp_data():
+def verify_adp_data(conn):
     """Verify the loaded ADP data"""
     print("\n🔍 Verifying ADP data...")
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -239,18 +284,22 @@ def verify_adp_data():
         
     finally:
         cur.close()
-        conn.close()
 
 if __name__ == "__main__":
     print("🚀 Loading Rotowire data into database...\n")
     
-    # Load ADP overall rankings
-    load_rotowire_adp()
-    
-    # Load position rankings
-    load_rotowire_position_rankings()
-    
-    # Verify the data
-    verify_adp_data()
+    # One connection for every step; each loader still commits its own work
+    conn = get_db_connection()
+    try:
+        # Load ADP overall rankings
+        load_rotowire_adp(conn)
+        
+        # Load position rankings
+        load_rotowire_position_rankings(conn)
+        
+        # Verify the data
+        verify_adp_data(conn)
+    finally:
+        conn.close()
     
     print("\n✅ Done!")
\ No newline at end of file
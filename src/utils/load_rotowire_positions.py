@@ -5,9 +5,19 @@ Load Rotowire position rankings correctly
 
 import pandas as pd
 import psycopg2
+from psycopg2.extras import execute_values
 import os
 from datetime import datetime
 
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READ_ENGINE = 'calamine'
+except ImportError:  # python-calamine is optional; fall back to openpyxl
+    EXCEL_READ_ENGINE = 'openpyxl'
+
+# Positions a Rotowire sheet or row can hold; DEF is loaded as DST
+VALID_POSITIONS = frozenset(['QB', 'RB', 'WR', 'TE', 'K', 'DST', 'DEF'])
+
 def get_db_connection():
     """Get database connection"""
     return psycopg2.connect(
@@ -18,17 +28,16 @@ def get_db_connection():
         database='fantasy_draft_db'
     )
 
-def inspect_rotowire_file():
+def inspect_rotowire_file(xl_file):
     """Inspect the Rotowire rankings file structure"""
     print("📊 Inspecting Rotowire rankings file...")
     
     try:
-        xl_file = pd.ExcelFile('rotowire rankings.xlsx')
         print(f"✅ Found sheets: {xl_file.sheet_names}")
         
         for sheet_name in xl_file.sheet_names:
             print(f"\n📋 Sheet: {sheet_name}")
-            df = pd.read_excel('rotowire rankings.xlsx', sheet_name=sheet_name, nrows=10)
+            df = xl_file.parse(sheet_name, nrows=10)
             print(f"   Columns: {df.columns.tolist()}")
             print("   Sample data:")
             print(df.head(3))
@@ -36,7 +45,7 @@ def inspect_rotowire_file():
     except Exception as e:
         print(f"❌ Error inspecting file: {e}")
 
-def load_rotowire_position_rankings():
+def load_rotowire_position_rankings(xl_file):
     """Load Rotowire position rankings as a ranking source"""
     print("📊 Loading Rotowire position rankings...")
     
@@ -55,16 +64,10 @@ def load_rotowire_position_rankings():
         source_id = cur.fetchone()[0]
         print(f"✅ Using source ID: {source_id}")
         
-        # Clear existing rankings for this source
-        cur.execute("DELETE FROM player_rankings WHERE source_id = %s", (source_id,))
-        
-        # Read the file to see its actual structure
-        xl_file = pd.ExcelFile('rotowire rankings.xlsx')
-        
         # If there's only one sheet, try to parse it differently
         if len(xl_file.sheet_names) == 1:
             sheet_name = xl_file.sheet_names[0]
-            df = pd.read_excel('rotowire rankings.xlsx', sheet_name=sheet_name)
+            df = xl_file.parse(sheet_name)
             
             print(f"Working with sheet: {sheet_name}")
             print(f"Columns: {df.columns.tolist()}")
@@ -89,47 +92,57 @@ def load_rotowire_position_rankings():
             print(f"Detected columns - Name: {name_col}, Position: {position_col}, Rank: {rank_col}")
             
             if name_col and position_col:
-                inserted = 0
-                for idx, row in df.iterrows():
-                    player_name = row.get(name_col)
-                    position = row.get(position_col)
-                    rank = row.get(rank_col) if rank_col else (idx + 1)
-                    
-                    if pd.isna(player_name) or pd.isna(position):
-                        continue
-                    
-                    player_name = str(player_name).strip()
-                    position = str(position).strip().upper()
-                    
-                    # Skip invalid positions
-                    if position not in ['QB', 'RB', 'WR', 'TE', 'K', 'DST', 'DEF']:
-                        continue
-                    
-                    if position == 'DEF':
-                        position = 'DST'
-                    
-                    # Find player in database
-                    cur.execute("""
-                        SELECT player_id FROM players 
-                        WHERE LOWER(name) = LOWER(%s) AND position = %s
-                        LIMIT 1
-                    """, (player_name, position))
-                    
-                    player_result = cur.fetchone()
-                    if player_result:
-                        player_id = player_result[0]
-                        
-                        try:
-                            rank_int = int(rank)
-                            cur.execute("""
-                                INSERT INTO player_rankings (player_id, source_id, position_rank)
-                                VALUES (%s, %s, %s)
-                            """, (player_id, source_id, rank_int))
-                            inserted += 1
-                        except (ValueError, TypeError):
-                            continue
+                # Normalize names and positions column-wise and skip invalid positions
+                ranks = df[rank_col] if rank_col else pd.Series(range(1, len(df) + 1), index=df.index)
+                rows = pd.DataFrame({'name': df[name_col], 'position': df[position_col], 'rank': ranks})
+                rows = rows.dropna(subset=['name', 'position'])
+                rows = rows.assign(
+                    name=rows['name'].astype(str).str.strip(),
+                    position=rows['position'].astype(str).str.strip().str.upper(),
+                )
+                rows = rows[rows['position'].isin(VALID_POSITIONS)]
+                rows = rows.replace({'position': {'DEF': 'DST'}})
+                # Ranks that don't parse as numbers are skipped
+                rows = rows.assign(rank=pd.to_numeric(rows['rank'], errors='coerce')).dropna(subset=['rank'])
+                candidates = list(zip(rows['name'].tolist(), rows['position'].tolist(), rows['rank'].astype(int).tolist()))
+                
+                # Find every player in the database with one query
+                lookup_keys = list({(player_name.lower(), position) for player_name, position, _ in candidates})
+                player_ids = {
+                    (name, position): player_id
+                    for name, position, player_id in execute_values(cur, """
+                        SELECT LOWER(name), position, player_id FROM players
+                        WHERE (LOWER(name), position) IN (VALUES %s)
+                    """, lookup_keys, page_size=1000, fetch=True)
+                }
+                
+                batch = []
+                for player_name, position, rank in candidates:
+                    player_id = player_ids.get((player_name.lower(), position))
+                    if player_id:
+                        batch.append((player_id, source_id, rank))
+                
+                # Upsert every matched ranking as one array insert; a player listed
+                # twice keeps their first ranking, and unchanged rows are left untouched
+                first_rankings = {}
+                for row in batch:
+                    first_rankings.setdefault(row[0], row)
+                batch = list(first_rankings.values())
+                cur.execute("""
+                    INSERT INTO player_rankings (player_id, source_id, position_rank)
+                    SELECT * FROM unnest(%s::int[], %s::int[], %s::int[])
+                    ON CONFLICT (player_id, source_id, ranking_date)
+                    DO UPDATE SET position_rank = EXCLUDED.position_rank
+                    WHERE player_rankings.position_rank IS DISTINCT FROM EXCLUDED.position_rank
+                """, ([row[0] for row in batch], [row[1] for row in batch], [row[2] for row in batch]))
+                
+                # Drop this source's rankings that the sheet no longer lists
+                cur.execute("""
+                    DELETE FROM player_rankings
+                    WHERE source_id = %s AND NOT (player_id = ANY(%s) AND ranking_date = CURRENT_DATE)
+                """, (source_id, list(first_rankings)))
                 
-                print(f"✅ Inserted {inserted} Rotowire position rankings")
+                print(f"✅ Loaded {len(batch)} Rotowire position rankings")
         
         conn.commit()
         
@@ -142,6 +155,8 @@ def load_rotowire_position_rankings():
         conn.close()
 
 if __name__ == "__main__":
-    inspect_rotowire_file()
-    print("\n" + "="*50 + "\n")
-    load_rotowire_position_rankings()
\ No newline at end of file
+    # Open the workbook once for both inspection and loading
+    with pd.ExcelFile('rotowire rankings.xlsx', engine=EXCEL_READ_ENGINE) as xl_file:
+        inspect_rotowire_file(xl_file)
+        print("\n" + "="*50 + "\n")
+        load_rotowire_position_rankings(xl_file)
\ No newline at end of file
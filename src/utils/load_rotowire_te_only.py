@@ -5,9 +5,25 @@ Load Rotowire TE rankings correctly (TE only)
 
 import pandas as pd
 import psycopg2
+from psycopg2.extras import execute_values
 import os
+import re
 from datetime import datetime
 
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READ_ENGINE = 'calamine'
+except ImportError:  # python-calamine is optional; fall back to openpyxl
+    EXCEL_READ_ENGINE = 'openpyxl'
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional; fall back to LIKE matching in SQL
+    process = None
+
+# Name suffixes stripped before fuzzy matching
+_SUFFIX_RE = re.compile(r'\s+(?:Jr\.|Sr\.|III|II)$', re.IGNORECASE)
+
 def get_db_connection():
     """Get database connection"""
     return psycopg2.connect(
@@ -37,64 +53,97 @@ def load_rotowire_te_rankings():
         source_id = cur.fetchone()[0]
         print(f"✅ Using source ID: {source_id}")
         
-        # Clear existing rankings for this source
-        cur.execute("DELETE FROM player_rankings WHERE source_id = %s", (source_id,))
-        
         # Read the TE rankings
-        df = pd.read_excel('rotowire rankings.xlsx', sheet_name='CheatSheetTE')
+        df = pd.read_excel('rotowire rankings.xlsx', sheet_name='CheatSheetTE', engine=EXCEL_READ_ENGINE)
         print(f"✅ Loaded {len(df)} TE rankings from Rotowire")
         
-        inserted = 0
-        not_found = []
+        # Normalize the text columns once rather than per row
+        df = df.assign(**{
+            'Player Name': df['Player Name'].astype(str).str.strip(),
+            'Pos': df['Pos'].astype(str).str.strip().str.upper(),
+            'Team': df['Team'].astype(str).str.strip().str.upper(),
+        })
         
-        for idx, row in df.iterrows():
-            player_name = str(row['Player Name']).strip()
-            position = str(row['Pos']).strip().upper()
-            rank = int(row['Pos Rank'])
-            team = str(row['Team']).strip().upper()
-            
+        candidates = []
+        for player_name, position, _team, rank in df[['Player Name', 'Pos', 'Team', 'Pos Rank']].itertuples(index=False, name=None):
             if position != 'TE':
                 continue
             
-            # Find player in database - try multiple variations
-            player_found = False
-            
-            # Try exact match first
+            candidates.append((player_name, position, int(rank)))
+        
+        # Find players in database - try multiple variations, each one a single
+        # query covering every row. Exact match first
+        player_ids = {
+            (name, position): player_id
+            for name, position, player_id in execute_values(cur, """
+                SELECT LOWER(name), position, player_id FROM players
+                WHERE (LOWER(name), position) IN (VALUES %s)
+            """, list({(player_name.lower(), position) for player_name, position, _ in candidates}),
+                page_size=1000, fetch=True)
+        }
+        
+        # Try fuzzy match without Jr./Sr. suffixes for the rest
+        fuzzy_ids = {}
+        misses = [player_name for player_name, position, _ in candidates if (player_name.lower(), position) not in player_ids]
+        if misses and process is not None:
+            # The TE list is small, so preload it and match client-side
+            cur.execute("SELECT player_id, LOWER(name) FROM players WHERE position = 'TE'")
+            choices = dict(cur.fetchall())
+            for player_name in misses:
+                clean_name = _SUFFIX_RE.sub('', player_name)
+                match = process.extractOne(clean_name.lower(), choices, scorer=fuzz.WRatio, score_cutoff=85)
+                if match:
+                    fuzzy_ids[player_name] = match[2]
+        elif misses:
+            patterns = {}
+            for player_name in misses:
+                clean_name = _SUFFIX_RE.sub('', player_name)
+                patterns[player_name] = f"%{clean_name}%"
             cur.execute("""
-                SELECT player_id FROM players 
-                WHERE LOWER(name) = LOWER(%s) AND position = %s
-                LIMIT 1
-            """, (player_name, position))
-            
-            player_result = cur.fetchone()
-            
-            if not player_result:
-                # Try fuzzy match without Jr./Sr. suffixes
-                clean_name = player_name.replace(' Jr.', '').replace(' Sr.', '').replace(' III', '').replace(' II', '')
-                cur.execute("""
-                    SELECT player_id FROM players 
-                    WHERE LOWER(name) LIKE LOWER(%s) AND position = %s
+                SELECT q.pattern, m.player_id
+                FROM unnest(%s::text[]) AS q(pattern)
+                CROSS JOIN LATERAL (
+                    SELECT player_id FROM players
+                    WHERE LOWER(name) LIKE LOWER(q.pattern) AND position = %s
                     LIMIT 1
-                """, (f"%{clean_name}%", position))
-                player_result = cur.fetchone()
-            
-            if player_result:
-                player_id = player_result[0]
-                
-                # Insert position ranking
-                cur.execute("""
-                    INSERT INTO player_rankings (player_id, source_id, position_rank)
-                    VALUES (%s, %s, %s)
-                """, (player_id, source_id, rank))
-                
-                inserted += 1
-                player_found = True
+                ) m
+            """, (list(set(patterns.values())), 'TE'))
+            by_pattern = dict(cur.fetchall())
+            fuzzy_ids = {name: by_pattern[pattern] for name, pattern in patterns.items() if pattern in by_pattern}
+        
+        batch = []
+        not_found = []
+        
+        for player_name, position, rank in candidates:
+            player_id = player_ids.get((player_name.lower(), position)) or fuzzy_ids.get(player_name)
             
-            if not player_found:
+            if player_id:
+                batch.append((player_id, source_id, rank))
+            else:
                 not_found.append((player_name, position, rank))
         
+        # Upsert every matched ranking as one array insert; a player listed
+        # twice keeps their first ranking, and unchanged rows are left untouched
+        first_rankings = {}
+        for row in batch:
+            first_rankings.setdefault(row[0], row)
+        batch = list(first_rankings.values())
+        cur.execute("""
+            INSERT INTO player_rankings (player_id, source_id, position_rank)
+            SELECT * FROM unnest(%s::int[], %s::int[], %s::int[])
+            ON CONFLICT (player_id, source_id, ranking_date)
+            DO UPDATE SET position_rank = EXCLUDED.position_rank
+            WHERE player_rankings.position_rank IS DISTINCT FROM EXCLUDED.position_rank
+        """, ([row[0] for row in batch], [row[1] for row in batch], [row[2] for row in batch]))
+        
+        # Drop this source's rankings that the sheet no longer lists
+        cur.execute("""
+            DELETE FROM player_rankings
+            WHERE source_id = %s AND NOT (player_id = ANY(%s) AND ranking_date = CURRENT_DATE)
+        """, (source_id, list(first_rankings)))
+        
         conn.commit()
-        print(f"✅ Inserted {inserted} Rotowire TE rankings")
+        print(f"✅ Loaded {len(batch)} Rotowire TE rankings")
         
         if not_found:
             print(f"\n⚠️ Players not found in database ({len(not_found)}):")
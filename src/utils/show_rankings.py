@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Shared expert consensus rankings display for the show_*_rankings scripts
+"""
+import sys
+sys.path.append('/Users/jeffgreenfield/dev/ff_draft_vibe')
+
+from functools import lru_cache
+import pandas as pd
+from complete_sleeper_assistant import CompleteDraftAssistant
+
+@lru_cache(maxsize=None)
+def get_assistant():
+    """Build the draft assistant once per process"""
+    return CompleteDraftAssistant("dummy_id")
+
+def show_rankings(players_data, with_teams=True):
+    """Print the ranked players in players_data, (name, position, team) tuples,
+    with tier separators and return the rankings sorted by consensus"""
+    assistant = get_assistant()
+    width = 85 if with_teams else 80
+    
+    # Get rankings for all players
+    all_rankings = []
+    
+    for name, pos, team in players_data:
+        player_obj = {"name": name, "position": pos, "team": team}
+        consensus, high, low, std = assistant.get_player_expert_data(player_obj)
+        
+        if consensus < 999:  # Has ranking data
+            all_rankings.append({
+                'name': name,
+                'position': pos,
+                'team': team,
+                'consensus': consensus,
+                'high': high,
+                'low': low,
+                'std': std,
+                'range': low - high
+            })
+    
+    # Sort by consensus ranking
+    all_rankings.sort(key=lambda x: x['consensus'])
+    
+    # Calculate VORP for everyone at once (using all ranked players for context)
+    vorp_scores = assistant.calculate_vorp_batch(
+        pd.DataFrame(all_rankings).rename(columns={'position': 'Position'})).tolist()
+    
+    # Display rankings with VORP; collect the table and write it in one go
+    out = [
+        "🏈 2025 FANTASY FOOTBALL EXPERT CONSENSUS RANKINGS",
+        "=" * width,
+        "Format: Rank | Player Name (Position) - Team | Range | Std Dev | VORP",
+        "-" * width,
+    ]
+    for i, (player_data, vorp) in enumerate(zip(all_rankings, vorp_scores)):
+        name = player_data['name']
+        pos = player_data['position']
+        consensus = player_data['consensus']
+        high = player_data['high']
+        low = player_data['low']
+        std = player_data['std']
+        
+        if with_teams:
+            out.append(f"{consensus:3d} | {name:<22} ({pos}) - {player_data['team']} | {high:2d}-{low:3d} | {std:4.1f} | {vorp:5.1f}")
+        else:
+            out.append(f"{consensus:3d} | {name:<22} ({pos}) | {high:2d}-{low:2d} | {std:4.1f} | {vorp:5.1f}")
+        
+        # Add tier separators
+        if i < len(all_rankings) - 1:
+            next_consensus = all_rankings[i + 1]['consensus']
+            if consensus <= 15 and next_consensus > 15:
+                out.append("    " + "-" * (width - 10) + " [ELITE TIER]")
+            elif consensus <= 30 and next_consensus > 30:
+                out.append("    " + "-" * (width - 10) + " [TIER 2]")
+            elif consensus <= 50 and next_consensus > 50:
+                out.append("    " + "-" * (width - 10) + " [TIER 3]")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    
+    return all_rankings
@@ -5,7 +5,78 @@ Debug script to show expert rankings, ranges, and detailed math calculations
 import sys
 sys.path.append('/Users/jeffgreenfield/dev/ff_draft_vibe')
 
-from complete_sleeper_assistant import CompleteDraftAssistant
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from complete_sleeper_assistant import CompleteDraftAssistant, POSITION_MULTIPLIERS
+
+def _sample(*rows):
+    """Parallel name/position/team/player_id arrays for (name, position, team) rows"""
+    names, positions, teams = zip(*rows)
+    return {
+        'name': np.array(names, dtype=object),
+        'position': np.array(positions),
+        'team': np.array(teams),
+        'player_id': np.arange(1, len(rows) + 1),
+    }
+
+# Sample of top players to show rankings
+SAMPLE_PLAYERS = _sample(
+    ("Ja'Marr Chase", "WR", "CIN"),
+    ("Bijan Robinson", "RB", "ATL"),
+    ("Justin Jefferson", "WR", "MIN"),
+    ("CeeDee Lamb", "WR", "DAL"),
+    ("Saquon Barkley", "RB", "PHI"),
+    ("Jahmyr Gibbs", "RB", "DET"),
+    ("Amon-Ra St. Brown", "WR", "DET"),
+    ("Puka Nacua", "WR", "LAR"),
+    ("Malik Nabers", "WR", "NYG"),
+    ("De'Von Achane", "RB", "MIA"),
+    ("Brian Thomas Jr.", "WR", "JAX"),
+    ("Ashton Jeanty", "RB", "LV"),
+    ("Brock Bowers", "TE", "LV"),
+    ("Christian McCaffrey", "RB", "SF"),
+    ("Josh Jacobs", "RB", "GB"),
+    ("A.J. Brown", "WR", "PHI"),
+    ("Josh Allen", "QB", "BUF"),
+    ("Lamar Jackson", "QB", "BAL"),
+    ("Aaron Jones", "RB", "MIN"),
+    ("Calvin Ridley", "WR", "TEN"),
+    ("Alvin Kamara", "RB", "NO"),
+)
+
+# Sample available players for the VORP calculations
+SAMPLE_AVAILABLE = _sample(
+    ("Josh Jacobs", "RB", "GB"),
+    ("Aaron Jones", "RB", "MIN"),
+    ("Alvin Kamara", "RB", "NO"),
+    ("A.J. Brown", "WR", "PHI"),
+    ("Calvin Ridley", "WR", "TEN"),
+    ("Brock Bowers", "TE", "LV"),
+    ("Josh Allen", "QB", "BUF"),
+)
+
+# Sample RBs for scarcity calculation
+SAMPLE_RBS = _sample(
+    ("Josh Jacobs", "RB", "GB"),
+    ("Aaron Jones", "RB", "MIN"),
+    ("Alvin Kamara", "RB", "NO"),
+    ("Austin Ekeler", "RB", "WAS"),
+)
+
+# Position multipliers as a sorted lookup table, gathered with searchsorted
+POSITION_CODES = np.array(sorted(POSITION_MULTIPLIERS))
+POSITION_MULT = np.array([POSITION_MULTIPLIERS[pos] for pos in POSITION_CODES])
+
+@lru_cache(maxsize=None)
+def _get_assistant():
+    """Build the draft assistant once and share it across the analyses"""
+    return CompleteDraftAssistant("dummy_id")
+
+@lru_cache(maxsize=4096)
+def _cached_expert(name, position, team):
+    """Expert data for a player, memoized across the analyses below"""
+    return _get_assistant().get_player_expert_data({"name": name, "position": position, "team": team})
 
 def show_expert_rankings():
     """Display the expert rankings data with ranges"""
@@ -14,39 +85,14 @@ def show_expert_rankings():
     print("Format: Player Name | Consensus | Best Case | Worst Case | Std Dev | Range")
     print("-" * 80)
     
-    # Create assistant instance to access methods
-    assistant = CompleteDraftAssistant("dummy_id")
-    
-    # Sample of top players to show rankings
-    sample_players = [
-        {"name": "Ja'Marr Chase", "position": "WR", "team": "CIN"},
-        {"name": "Bijan Robinson", "position": "RB", "team": "ATL"},
-        {"name": "Justin Jefferson", "position": "WR", "team": "MIN"},
-        {"name": "CeeDee Lamb", "position": "WR", "team": "DAL"},
-        {"name": "Saquon Barkley", "position": "RB", "team": "PHI"},
-        {"name": "Jahmyr Gibbs", "position": "RB", "team": "DET"},
-        {"name": "Amon-Ra St. Brown", "position": "WR", "team": "DET"},
-        {"name": "Puka Nacua", "position": "WR", "team": "LAR"},
-        {"name": "Malik Nabers", "position": "WR", "team": "NYG"},
-        {"name": "De'Von Achane", "position": "RB", "team": "MIA"},
-        {"name": "Brian Thomas Jr.", "position": "WR", "team": "JAX"},
-        {"name": "Ashton Jeanty", "position": "RB", "team": "LV"},
-        {"name": "Brock Bowers", "position": "TE", "team": "LV"},
-        {"name": "Christian McCaffrey", "position": "RB", "team": "SF"},
-        {"name": "Josh Jacobs", "position": "RB", "team": "GB"},
-        {"name": "A.J. Brown", "position": "WR", "team": "PHI"},
-        {"name": "Josh Allen", "position": "QB", "team": "BUF"},
-        {"name": "Lamar Jackson", "position": "QB", "team": "BAL"},
-        {"name": "Aaron Jones", "position": "RB", "team": "MIN"},
-        {"name": "Calvin Ridley", "position": "WR", "team": "TEN"},
-        {"name": "Alvin Kamara", "position": "RB", "team": "NO"},
-    ]
-    
-    for player in sample_players:
-        consensus, high, low, std = assistant.get_player_expert_data(player)
+    out = []
+    for name, position, team in zip(SAMPLE_PLAYERS['name'], SAMPLE_PLAYERS['position'], SAMPLE_PLAYERS['team']):
+        consensus, high, low, std = _cached_expert(name, position, team)
         if consensus < 999:  # Has ranking data
             range_size = low - high
-            print(f"{player['name']:<20} | #{consensus:>3} | #{high:>3} | #{low:>3} | {std:>4.1f} | {range_size:>3}")
+            out.append(f"{name:<20} | #{consensus:>3} | #{high:>3} | #{low:>3} | {std:>4.1f} | {range_size:>3}")
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
     
     print("\n📊 INTERPRETATION:")
     print("• Consensus: Average ranking across all expert sources")
@@ -60,102 +106,81 @@ def show_vorp_calculations():
     print("\n\n⚡ VALUE OVER REPLACEMENT PLAYER (VORP) CALCULATIONS")
     print("=" * 80)
     
-    assistant = CompleteDraftAssistant("dummy_id")
-    
-    # Create sample available players for calculations
-    sample_available = [
-        {"name": "Josh Jacobs", "position": "RB", "team": "GB", "player_id": "1"},
-        {"name": "Aaron Jones", "position": "RB", "team": "MIN", "player_id": "2"},
-        {"name": "Alvin Kamara", "position": "RB", "team": "NO", "player_id": "3"},
-        {"name": "A.J. Brown", "position": "WR", "team": "PHI", "player_id": "4"},
-        {"name": "Calvin Ridley", "position": "WR", "team": "TEN", "player_id": "5"},
-        {"name": "Brock Bowers", "position": "TE", "team": "LV", "player_id": "6"},
-        {"name": "Josh Allen", "position": "QB", "team": "BUF", "player_id": "7"},
-    ]
+    assistant = _get_assistant()
     
     print("Showing VORP calculation breakdown for sample players:\n")
     
-    for player in sample_available:
-        print(f"🎯 {player['name']} ({player['position']}) - {player['team']}")
-        print("-" * 50)
-        
-        # Get expert data
-        consensus, high, low, std = assistant.get_player_expert_data(player)
-        print(f"Expert Data: Consensus #{consensus}, Range #{high}-#{low}, Std Dev {std}")
+    # Get expert data for every player at once
+    positions = SAMPLE_AVAILABLE['position']
+    expert = assistant.get_expert_data_batch(pd.DataFrame({'Player_Name': SAMPLE_AVAILABLE['name']}))
+    consensus = expert['consensus'].to_numpy(dtype=int)
+    high = expert['high'].to_numpy(dtype=int)
+    low = expert['low'].to_numpy(dtype=int)
+    std = expert['std'].to_numpy()
+    
+    # Individual positional scarcity: drop-off to the next-worse ranked player
+    # at the same position, or 0 for the last one
+    worse = ((positions[:, None] == positions[None, :])
+             & (consensus[None, :] < 999)
+             & (consensus[None, :] > consensus[:, None]))
+    next_consensus = np.where(worse, consensus[None, :], 999).min(axis=1)
+    drop_off = np.where(worse.any(axis=1), next_consensus - consensus, 0)
+    
+    # Calculate each component for all players in one pass
+    base_value = np.maximum(0, 200 - consensus)
+    scarcity_bonus = drop_off * 2
+    upside_potential = np.maximum(0, consensus - high) * 1.5
+    stability_bonus = np.maximum(0, 10 - std)
+    ceiling_floor_bonus = (low - high) * 0.3
+    codes = np.searchsorted(POSITION_CODES, positions).clip(max=len(POSITION_CODES) - 1)
+    multiplier = np.where(POSITION_CODES[codes] == positions, POSITION_MULT[codes], 1.0)
+    subtotal = base_value + scarcity_bonus + upside_potential + stability_bonus + ceiling_floor_bonus
+    final_vorp = subtotal * multiplier
+    
+    # Collect the breakdown for every player and write it in one go
+    out = []
+    for i, (name, team) in enumerate(zip(SAMPLE_AVAILABLE['name'], SAMPLE_AVAILABLE['team'])):
+        out.append(f"🎯 {name} ({positions[i]}) - {team}")
+        out.append("-" * 50)
+        out.append(f"Expert Data: Consensus #{consensus[i]}, Range #{high[i]}-#{low[i]}, Std Dev {std[i]}")
         
-        if consensus >= 999:
-            print("❌ No ranking data available\n")
+        if consensus[i] >= 999:
+            out.append("❌ No ranking data available\n")
             continue
         
-        # Calculate each component
-        base_value = max(0, 200 - consensus)
-        print(f"1. Base Value = max(0, 200 - {consensus}) = {base_value}")
-        
-        # Individual positional scarcity
-        drop_off, uncertainty = assistant.calculate_individual_positional_scarcity(player, sample_available)
-        scarcity_bonus = drop_off * 2
-        print(f"2. Positional Scarcity = {drop_off} * 2 = {scarcity_bonus}")
-        
-        # Upside potential
-        upside_potential = max(0, consensus - high) * 1.5
-        print(f"3. Upside Potential = max(0, {consensus} - {high}) * 1.5 = {upside_potential}")
-        
-        # Stability bonus
-        stability_bonus = max(0, 10 - std)
-        print(f"4. Stability Bonus = max(0, 10 - {std}) = {stability_bonus}")
-        
-        # Ceiling-floor bonus
-        range_factor = low - high
-        ceiling_floor_bonus = range_factor * 0.3
-        print(f"5. Ceiling-Floor Bonus = ({low} - {high}) * 0.3 = {ceiling_floor_bonus}")
+        out.append(f"1. Base Value = max(0, 200 - {consensus[i]}) = {base_value[i]}")
+        out.append(f"2. Positional Scarcity = {drop_off[i]} * 2 = {scarcity_bonus[i]}")
+        out.append(f"3. Upside Potential = max(0, {consensus[i]} - {high[i]}) * 1.5 = {upside_potential[i]}")
+        out.append(f"4. Stability Bonus = max(0, 10 - {std[i]}) = {stability_bonus[i]}")
+        out.append(f"5. Ceiling-Floor Bonus = ({low[i]} - {high[i]}) * 0.3 = {ceiling_floor_bonus[i]}")
+        out.append(f"6. Subtotal = {base_value[i]} + {scarcity_bonus[i]} + {upside_potential[i]} + {stability_bonus[i]} + {ceiling_floor_bonus[i]} = {subtotal[i]}")
+        out.append(f"7. Final VORP = {subtotal[i]} * {multiplier[i]} = {final_vorp[i]:.1f}")
         
-        # Position multiplier
-        position_multipliers = {
-            'RB': 1.15, 'WR': 1.10, 'TE': 1.05, 'QB': 0.85, 'K': 0.1, 'D/ST': 0.2
-        }
-        multiplier = position_multipliers.get(player['position'], 1.0)
-        
-        # Total before multiplier
-        subtotal = base_value + scarcity_bonus + upside_potential + stability_bonus + ceiling_floor_bonus
-        print(f"6. Subtotal = {base_value} + {scarcity_bonus} + {upside_potential} + {stability_bonus} + {ceiling_floor_bonus} = {subtotal}")
-        
-        # Final VORP
-        final_vorp = subtotal * multiplier
-        print(f"7. Final VORP = {subtotal} * {multiplier} = {final_vorp:.1f}")
-        
-        print()
+        out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def show_positional_scarcity_math():
     """Show how positional scarcity is calculated"""
     print("\n\n📈 POSITIONAL SCARCITY CALCULATIONS")
     print("=" * 80)
     
-    assistant = CompleteDraftAssistant("dummy_id")
-    
-    # Sample RBs for scarcity calculation
-    sample_rbs = [
-        {"name": "Josh Jacobs", "position": "RB", "team": "GB", "player_id": "1"},
-        {"name": "Aaron Jones", "position": "RB", "team": "MIN", "player_id": "2"},
-        {"name": "Alvin Kamara", "position": "RB", "team": "NO", "player_id": "3"},
-        {"name": "Austin Ekeler", "position": "RB", "team": "WAS", "player_id": "4"},
-    ]
-    
     print("Example: RB Position Scarcity Analysis")
     print("-" * 40)
     
     print("Available RBs with rankings:")
     rb_data = []
-    for rb in sample_rbs:
-        consensus, high, low, std = assistant.get_player_expert_data(rb)
+    for name, position, team in zip(SAMPLE_RBS['name'], SAMPLE_RBS['position'], SAMPLE_RBS['team']):
+        consensus, high, low, std = _cached_expert(name, position, team)
         if consensus < 999:
             rb_data.append({
-                'name': rb['name'],
+                'name': name,
                 'consensus': consensus,
                 'high': high,
                 'low': low,
                 'std': std
             })
-            print(f"  {rb['name']}: #{consensus} (range #{high}-#{low}, std {std})")
+            print(f"  {name}: #{consensus} (range #{high}-#{low}, std {std})")
     
     if len(rb_data) >= 2:
         # Sort by consensus (best first)
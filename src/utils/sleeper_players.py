@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Shared on-disk cache of the Sleeper NFL player list for the export and debug scripts
+"""
+import json
+import os
+import tempfile
+import time
+import requests
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to loading the whole document
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
+SLEEPER_PLAYERS_URL = "https://api.sleeper.app/v1/players/nfl"
+
+# Sleeper asks clients to fetch the full player list at most once a day
+SLEEPER_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'sleeper_players_nfl.json')
+SLEEPER_CACHE_SECONDS = 24 * 60 * 60
+SLEEPER_ETAG_PATH = SLEEPER_CACHE_PATH + '.etag'
+
+def refresh_sleeper_cache():
+    """Make sure the on-disk Sleeper player list is under a day old; False if it can't be fetched"""
+    try:
+        if time.time() - os.path.getmtime(SLEEPER_CACHE_PATH) < SLEEPER_CACHE_SECONDS:
+            return True
+    except OSError:
+        pass  # no cache yet
+    
+    # Revalidate a stale copy with its ETag so an unchanged list isn't re-sent
+    headers = {}
+    if os.path.exists(SLEEPER_CACHE_PATH):
+        try:
+            with open(SLEEPER_ETAG_PATH) as f:
+                headers['If-None-Match'] = f.read().strip()
+        except OSError:
+            pass  # no ETag saved; do a plain fetch
+    
+    # Stream the ~10MB body to disk in chunks rather than holding it all in memory
+    with requests.get(SLEEPER_PLAYERS_URL, headers=headers, stream=True, timeout=(3.05, 60)) as response:
+        if response.status_code == 304:
+            os.utime(SLEEPER_CACHE_PATH)  # still current; good for another day
+            return True
+        if response.status_code != 200:
+            print(f"❌ Error loading players: {response.status_code}")
+            return False
+        
+        # Write to a temp file and swap it in so a reader never sees half a file
+        tmp_path = SLEEPER_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+        etag = response.headers.get('ETag')
+    os.replace(tmp_path, SLEEPER_CACHE_PATH)
+    
+    if etag:
+        with open(SLEEPER_ETAG_PATH, 'w') as f:
+            f.write(etag)
+    elif os.path.exists(SLEEPER_ETAG_PATH):
+        os.remove(SLEEPER_ETAG_PATH)  # don't pair an old ETag with the new body
+    return True
+
+def iter_sleeper_players():
+    """Yield (player_id, player_data) for every Sleeper NFL player from the disk cache
+    
+    With ijson installed the file is parsed incrementally, so only one player's
+    dict is alive at a time instead of the whole ~11k-player document;
+    otherwise the whole file is decoded at once, with orjson if available.
+    """
+    with open(SLEEPER_CACHE_PATH, 'rb') as f:
+        if ijson is not None:
+            yield from ijson.kvitems(f, '', use_float=True)
+        elif orjson is not None:
+            yield from orjson.loads(f.read()).items()
+        else:
+            yield from json.load(f).items()
+
+def load_sleeper_players():
+    """Load all Sleeper NFL players as a dict keyed by player_id; None if they can't be fetched"""
+    if not refresh_sleeper_cache():
+        return None
+    
+    with open(SLEEPER_CACHE_PATH, 'rb') as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
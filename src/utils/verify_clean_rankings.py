@@ -2,30 +2,43 @@
 """
 Verify the clean integer ranking system addresses the methodology consistency issue
 """
+import sys
+import numpy as np
 import pandas as pd
 
+def format_ranking_lines(rows):
+    """One display line per player for the sample ranking listings"""
+    return [f"   {int(final_rank):3d}. {name:<25} ({pos}) | {'Expert' if has_expert else 'Composite'} | VORP: {vorp:5.1f}"
+            for final_rank, name, pos, has_expert, vorp in
+            rows[['Final_Rank', 'Player_Name', 'Position', 'Has_Expert_Data', 'VORP_Score']].itertuples(index=False, name=None)]
+
 def verify_clean_rankings():
     print("✅ VERIFYING CLEAN INTEGER RANKING SYSTEM")
     print("🎯 Confirming consistent methodology and proper integer rankings")
     print("=" * 65)
     
     try:
-        # Read the clean rankings
+        # Read the clean rankings; only the columns we check get parsed
         df = pd.read_excel('/Users/jeffgreenfield/dev/ff_draft_vibe/FF_2025_CLEAN_Integer_Rankings.xlsx', 
-                           sheet_name='Clean_Integer_Rankings')
+                           sheet_name='Clean_Integer_Rankings', engine='openpyxl',
+                           usecols=['Final_Rank', 'High_Rank', 'Low_Rank', 'Std_Deviation', 'VORP_Score',
+                                    'Has_Expert_Data', 'Player_Name', 'Position', 'Position_Rank'])
+        # Treat a blank expert flag as composite so the flag works as a plain mask
+        df = df.assign(Has_Expert_Data=df['Has_Expert_Data'].astype('boolean').fillna(False))
         
         print(f"📊 Total players in system: {len(df)}")
         
         # CRITICAL TEST 1: Verify integer rankings 1-N with no gaps
         print(f"\n🔍 RANKING INTEGRITY TEST:")
-        expected_ranks = set(range(1, len(df) + 1))
-        actual_ranks = set(df['Final_Rank'].tolist())
+        expected_ranks = np.arange(1, len(df) + 1)
+        actual_ranks = df['Final_Rank'].to_numpy()
+        ranks_sequential = np.array_equal(np.sort(actual_ranks), expected_ranks)
         
-        if expected_ranks == actual_ranks:
+        if ranks_sequential:
             print(f"✅ Perfect integer sequence: 1-{len(df)}")
         else:
-            missing = expected_ranks - actual_ranks
-            duplicates = len(df) - len(actual_ranks)
+            missing = set(np.setdiff1d(expected_ranks, actual_ranks).tolist())
+            duplicates = int(df['Final_Rank'].duplicated().sum())
             print(f"❌ Ranking issues - Missing: {missing}, Duplicates: {duplicates}")
         
         # CRITICAL TEST 2: Verify data types
@@ -35,8 +48,9 @@ def verify_clean_rankings():
         else:
             print(f"❌ Rankings are not integers: {df['Final_Rank'].dtype}")
         
-        # CRITICAL TEST 3: Verify no float rankings
-        has_floats = any(isinstance(rank, float) for rank in df['Final_Rank'])
+        # CRITICAL TEST 3: Verify no float rankings (the column dtype tells us
+        # without boxing every cell)
+        has_floats = not pd.api.types.is_integer_dtype(df['Final_Rank'])
         if not has_floats:
             print(f"✅ No float rankings detected")
         else:
@@ -69,28 +83,16 @@ def verify_clean_rankings():
         # TEST 5: Show ranking methodology consistency
         print(f"\n📊 METHODOLOGY CONSISTENCY TEST:")
         
-        expert_players = df[df['Has_Expert_Data'] == True]
-        composite_players = df[df['Has_Expert_Data'] == False]
+        # One mask for both groups; only the required columns get sliced out
+        has_expert = df['Has_Expert_Data'].to_numpy(dtype=bool)
         
-        print(f"🧠 Players with expert data: {len(expert_players)}")
-        print(f"🎯 Players with composite scoring: {len(composite_players)}")
+        print(f"🧠 Players with expert data: {int(has_expert.sum())}")
+        print(f"🎯 Players with composite scoring: {int((~has_expert).sum())}")
         
         # Show that both groups have same analytical structure
-        expert_complete = (
-            expert_players['Final_Rank'].notna().all() and
-            expert_players['High_Rank'].notna().all() and
-            expert_players['Low_Rank'].notna().all() and
-            expert_players['Std_Deviation'].notna().all() and
-            expert_players['VORP_Score'].notna().all()
-        )
-        
-        composite_complete = (
-            composite_players['Final_Rank'].notna().all() and
-            composite_players['High_Rank'].notna().all() and
-            composite_players['Low_Rank'].notna().all() and
-            composite_players['Std_Deviation'].notna().all() and
-            composite_players['VORP_Score'].notna().all()
-        )
+        required = ['Final_Rank', 'High_Rank', 'Low_Rank', 'Std_Deviation', 'VORP_Score']
+        expert_complete = not df.loc[has_expert, required].isna().to_numpy().any()
+        composite_complete = not df.loc[~has_expert, required].isna().to_numpy().any()
         
         if expert_complete and composite_complete:
             print(f"✅ Both groups have complete analytical data")
@@ -102,32 +104,33 @@ def verify_clean_rankings():
         
         print(f"📊 Top 10 players:")
         top_10 = df.head(10)
-        for _, row in top_10.iterrows():
-            rank_type = "Expert" if row['Has_Expert_Data'] else "Composite"
-            print(f"   {int(row['Final_Rank']):3d}. {row['Player_Name']:<25} ({row['Position']}) | {rank_type} | VORP: {row['VORP_Score']:5.1f}")
+        out = format_ranking_lines(top_10)
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         print(f"\n🔍 Ranks 91-100 (transition area):")
         transition = df[(df['Final_Rank'] >= 91) & (df['Final_Rank'] <= 100)]
-        for _, row in transition.iterrows():
-            rank_type = "Expert" if row['Has_Expert_Data'] else "Composite"
-            print(f"   {int(row['Final_Rank']):3d}. {row['Player_Name']:<25} ({row['Position']}) | {rank_type} | VORP: {row['VORP_Score']:5.1f}")
+        out = format_ranking_lines(transition)
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         print(f"\n🎯 Ranks 101-110 (post-expert area):")
         post_expert = df[(df['Final_Rank'] >= 101) & (df['Final_Rank'] <= 110)]
-        for _, row in post_expert.iterrows():
-            rank_type = "Expert" if row['Has_Expert_Data'] else "Composite"
-            print(f"   {int(row['Final_Rank']):3d}. {row['Player_Name']:<25} ({row['Position']}) | {rank_type} | VORP: {row['VORP_Score']:5.1f}")
+        out = format_ranking_lines(post_expert)
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         # TEST 7: Verify position ranking integrity
         print(f"\n📈 POSITION RANKING INTEGRITY:")
+        # In each position, the sorted ranks should read 1, 2, 3, ...
+        by_position = df[['Position', 'Position_Rank']].sort_values(['Position', 'Position_Rank'])
+        expected_pos_ranks = by_position.groupby('Position').cumcount() + 1
+        bad_positions = set(by_position.loc[by_position['Position_Rank'] != expected_pos_ranks, 'Position'])
+        position_counts = by_position['Position'].value_counts()
         for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST']:
-            pos_df = df[df['Position'] == pos]
-            if len(pos_df) > 0:
-                pos_ranks = sorted(pos_df['Position_Rank'].tolist())
-                expected_pos_ranks = list(range(1, len(pos_df) + 1))
-                
-                if pos_ranks == expected_pos_ranks:
-                    print(f"   ✅ {pos}: Perfect position ranks 1-{len(pos_df)}")
+            if pos in position_counts:
+                if pos not in bad_positions:
+                    print(f"   ✅ {pos}: Perfect position ranks 1-{position_counts[pos]}")
                 else:
                     print(f"   ❌ {pos}: Position ranking issues")
         
@@ -135,7 +138,7 @@ def verify_clean_rankings():
         
         # Final summary
         all_tests_passed = (
-            expected_ranks == actual_ranks and  # Perfect integer sequence
+            ranks_sequential and  # Perfect integer sequence
             df['Final_Rank'].dtype in ['int64', 'int32'] and  # Integer data type
             not has_floats and  # No float rankings
             high_low_valid and  # Logical high/low ranges
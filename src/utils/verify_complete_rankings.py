@@ -2,6 +2,7 @@
 """
 Verify the complete ranking system
 """
+import sys
 import pandas as pd
 
 def verify_complete_rankings():
@@ -9,9 +10,13 @@ def verify_complete_rankings():
     print("=" * 50)
     
     try:
-        # Read the main sheet
+        # Read the main sheet; only the columns we check get parsed
         df = pd.read_excel('/Users/jeffgreenfield/dev/ff_draft_vibe/FF_2025_COMPLETE_All_Player_Rankings.xlsx', 
-                           sheet_name='All_Player_Rankings')
+                           sheet_name='All_Player_Rankings', engine='openpyxl',
+                           usecols=['Final_Rank', 'Player_Name', 'Position', 'Team', 'Expert_Rank',
+                                    'VORP_Score', 'Has_Expert_Ranking'])
+        # Treat a blank expert flag as algorithmic so the flag works as a plain mask
+        df = df.assign(Has_Expert_Ranking=df['Has_Expert_Ranking'].astype('boolean').fillna(False))
         
         print(f"📊 Total players in system: {len(df)}")
         
@@ -33,13 +38,14 @@ def verify_complete_rankings():
         # Show top players from each ranking method
         print(f"\n🏆 TOP 10 OVERALL PLAYERS:")
         top_10 = df.head(10)[['Final_Rank', 'Player_Name', 'Position', 'Team', 'Expert_Rank', 'VORP_Score']]
-        for _, row in top_10.iterrows():
-            expert_indicator = "📊" if pd.notna(row['Expert_Rank']) else "🤖"
-            print(f"  {expert_indicator} {int(row['Final_Rank']):3d}. {row['Player_Name']:<22} ({row['Position']}) - {row['Team']} | VORP: {row['VORP_Score']}")
+        out = [f"  {'📊' if pd.notna(expert_rank) else '🤖'} {int(final_rank):3d}. {name:<22} ({pos}) - {team} | VORP: {vorp}"
+               for final_rank, name, pos, team, expert_rank, vorp in top_10.itertuples(index=False, name=None)]
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         # Show where algorithmic rankings start
-        expert_players = df[df['Has_Expert_Ranking'] == True]
-        algo_players = df[df['Has_Expert_Ranking'] == False]
+        expert_players = df[df['Has_Expert_Ranking']]
+        algo_players = df[~df['Has_Expert_Ranking']]
         
         print(f"\n📊 Expert rankings: 1 - {expert_players['Final_Rank'].max()}")
         print(f"🤖 Algorithmic rankings: {algo_players['Final_Rank'].min()} - {algo_players['Final_Rank'].max()}")
@@ -47,28 +53,35 @@ def verify_complete_rankings():
         # Show first few algorithmic players
         print(f"\n🤖 FIRST 5 ALGORITHMIC PLAYERS:")
         first_algo = algo_players.head(5)[['Final_Rank', 'Player_Name', 'Position', 'Team', 'VORP_Score']]
-        for _, row in first_algo.iterrows():
-            print(f"  🤖 {int(row['Final_Rank']):3d}. {row['Player_Name']:<22} ({row['Position']}) - {row['Team']} | VORP: {row['VORP_Score']}")
+        out = [f"  🤖 {int(final_rank):3d}. {name:<22} ({pos}) - {team} | VORP: {vorp}"
+               for final_rank, name, pos, team, vorp in first_algo.itertuples(index=False, name=None)]
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         # Position breakdown
         print(f"\n📈 POSITION VERIFICATION:")
+        # One grouped pass for every position's counts and top player (the
+        # first row listed for it)
+        position_summary = df.assign(is_algo=~df['Has_Expert_Ranking']).groupby('Position').agg(
+            total=('Player_Name', 'size'),
+            expert_count=('Has_Expert_Ranking', 'sum'),
+            algo_count=('is_algo', 'sum'),
+            top_name=('Player_Name', 'first'),
+            top_expert=('Has_Expert_Ranking', 'first'),
+        )
         for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'D/ST']:
-            pos_df = df[df['Position'] == pos]
-            expert_count = len(pos_df[pos_df['Has_Expert_Ranking'] == True])
-            algo_count = len(pos_df[pos_df['Has_Expert_Ranking'] == False])
-            
-            if len(pos_df) > 0:
-                top_player = pos_df.iloc[0]
-                ranking_type = "📊 Expert" if top_player['Has_Expert_Ranking'] else "🤖 Algo"
-                print(f"  {pos}: {len(pos_df)} total ({expert_count} expert + {algo_count} algo) | Top: {ranking_type} - {top_player['Player_Name']}")
+            if pos in position_summary.index:
+                row = position_summary.loc[pos]
+                ranking_type = "📊 Expert" if row['top_expert'] else "🤖 Algo"
+                print(f"  {pos}: {row['total']} total ({row['expert_count']} expert + {row['algo_count']} algo) | Top: {ranking_type} - {row['top_name']}")
         
         # Check for any major issues
         print(f"\n🔍 VALIDATION CHECKS:")
         
         # Check for duplicate ranks
-        duplicate_ranks = df[df.duplicated(['Final_Rank'], keep=False)]
-        if len(duplicate_ranks) > 0:
-            print(f"❌ Found {len(duplicate_ranks)} players with duplicate Final_Rank")
+        dup_count = int(df['Final_Rank'].duplicated(keep=False).sum())
+        if dup_count > 0:
+            print(f"❌ Found {dup_count} players with duplicate Final_Rank")
         else:
             print(f"✅ No duplicate Final_Rank values")
         
@@ -2,17 +2,26 @@
 """
 Verify the enhanced analytical system provides equivalent depth for all players
 """
+import sys
 import pandas as pd
 
+def format_top_lines(rows):
+    """One display line per player for the top-by-method listings"""
+    return [f"   {int(final_rank):3d}. {name:<25} | VORP: {vorp:5.1f} | Range: {rank_range:4.1f} | StdDev: {std:4.2f}"
+            for final_rank, name, vorp, rank_range, std in
+            rows[['Final_Rank', 'Player_Name', 'VORP_Score', 'Rank_Range', 'Std_Deviation']].itertuples(index=False, name=None)]
+
 def verify_enhanced_analytical_system():
     print("✅ VERIFYING ENHANCED ANALYTICAL SYSTEM")
     print("🎯 Confirming ALL players have equivalent analytical depth")
     print("=" * 60)
     
     try:
-        # Read the enhanced rankings
+        # Read the enhanced rankings; only the columns we check get parsed
         df = pd.read_excel('/Users/jeffgreenfield/dev/ff_draft_vibe/FF_2025_ENHANCED_All_Player_Rankings.xlsx', 
-                           sheet_name='All_Enhanced_Rankings')
+                           sheet_name='All_Enhanced_Rankings', engine='openpyxl',
+                           usecols=['Final_Rank', 'Player_Name', 'Position', 'Analysis_Method', 'Consensus_Rank',
+                                    'High_Rank', 'Low_Rank', 'Std_Deviation', 'Rank_Range', 'VORP_Score'])
         
         print(f"📊 Total players in enhanced system: {len(df)}")
         
@@ -54,33 +63,32 @@ def verify_enhanced_analytical_system():
         
         print(f"\n📊 Expert Analysis Top 5:")
         expert_top5 = expert_players.head(5)
-        for _, row in expert_top5.iterrows():
-            print(f"   {int(row['Final_Rank']):3d}. {row['Player_Name']:<25} | VORP: {row['VORP_Score']:5.1f} | Range: {row['Rank_Range']:4.1f} | StdDev: {row['Std_Deviation']:4.2f}")
+        out = format_top_lines(expert_top5)
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         print(f"\n🤖 Enhanced Algorithmic Top 5:")
         algo_top5 = algo_players.head(5)
-        for _, row in algo_top5.iterrows():
-            print(f"   {int(row['Final_Rank']):3d}. {row['Player_Name']:<25} | VORP: {row['VORP_Score']:5.1f} | Range: {row['Rank_Range']:4.1f} | StdDev: {row['Std_Deviation']:4.2f}")
+        out = format_top_lines(algo_top5)
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
         
         # Statistical comparison
         print(f"\n📈 ANALYTICAL DEPTH STATISTICS:")
         
-        expert_stats = {
-            'VORP': expert_players['VORP_Score'].describe(),
-            'Range': expert_players['Rank_Range'].describe(),
-            'StdDev': expert_players['Std_Deviation'].describe()
-        }
-        
-        algo_stats = {
-            'VORP': algo_players['VORP_Score'].describe(),
-            'Range': algo_players['Rank_Range'].describe(),
-            'StdDev': algo_players['Std_Deviation'].describe()
-        }
+        # Only mean/std/min/max are shown, so skip describe()'s percentiles and
+        # compute all of them in one grouped pass
+        metric_columns = {'VORP': 'VORP_Score', 'Range': 'Rank_Range', 'StdDev': 'Std_Deviation'}
+        method_stats = (df.groupby('Analysis_Method')[list(metric_columns.values())]
+                        .agg(['mean', 'std', 'min', 'max'])
+                        .reindex(['Expert Consensus', 'Enhanced Algorithmic Multi-Factor']))
         
-        for metric in ['VORP', 'Range', 'StdDev']:
+        for metric, col in metric_columns.items():
+            expert_stats = method_stats.loc['Expert Consensus', col]
+            algo_stats = method_stats.loc['Enhanced Algorithmic Multi-Factor', col]
             print(f"\n{metric} Score Distribution:")
-            print(f"   📊 Expert:     Mean {expert_stats[metric]['mean']:6.1f} | Std {expert_stats[metric]['std']:6.1f} | Range {expert_stats[metric]['min']:6.1f}-{expert_stats[metric]['max']:6.1f}")
-            print(f"   🤖 Algorithmic: Mean {algo_stats[metric]['mean']:6.1f} | Std {algo_stats[metric]['std']:6.1f} | Range {algo_stats[metric]['min']:6.1f}-{algo_stats[metric]['max']:6.1f}")
+            print(f"   📊 Expert:     Mean {expert_stats['mean']:6.1f} | Std {expert_stats['std']:6.1f} | Range {expert_stats['min']:6.1f}-{expert_stats['max']:6.1f}")
+            print(f"   🤖 Algorithmic: Mean {algo_stats['mean']:6.1f} | Std {algo_stats['std']:6.1f} | Range {algo_stats['min']:6.1f}-{algo_stats['max']:6.1f}")
         
         # Verify all positions have same analytical treatment
         print(f"\n📊 POSITION-LEVEL ANALYTICAL VERIFICATION:")